@@ -1,9 +1,15 @@
 # robot_tracker/core/__init__.py
 """
-Module core - Logique métier et algorithmes - Version 1.0
-Modification: Initialisation du module core
+Module core - Logique métier et algorithmes - Version 1.1
+Modification: CameraManager importé à la demande (import de core.config_manager sans numpy/cv2)
 """
 
-from .camera_manager import CameraManager
+__all__ = ['CameraManager']
 
-__all__ = ['CameraManager']
\ No newline at end of file
+
+def __getattr__(name):
+    # Import différé : les outils qui ne lisent que la configuration ne chargent pas la pile caméra
+    if name == 'CameraManager':
+        from .camera_manager import CameraManager
+        return CameraManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
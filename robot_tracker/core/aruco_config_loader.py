@@ -1,9 +1,10 @@
 # core/aruco_config_loader.py
-# Version 1.1 - Amélioration patterns détection et auto-ouverture dernier dossier
-# Modification: Meilleurs patterns de détection + auto-sélection dernier dossier
+# Version 1.5 - Manifeste de scan validé fichier par fichier
+# Modification: cache résolu depuis la racine de l'application, empreinte (mtime, taille) par fichier, erreurs JSON ignorées
 
 import os
 import json
+import hashlib
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -13,6 +14,11 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Manifestes des derniers scans, rangés dans le cache de l'application (un fichier par dossier scanné).
+# Chemin relatif résolu depuis la racine de l'application (parent du dossier config), jamais depuis le cwd.
+DEFAULT_SCAN_CACHE_DIR = 'cache/aruco'
+SCAN_MANIFEST_VERSION = 3
+
 class ArUcoConfigLoader:
     """Chargeur automatique de configuration ArUco depuis dossier généré"""
     
@@ -26,6 +32,11 @@ class ArUcoConfigLoader:
         # Dossier racine ArUco pour auto-détection
         self.aruco_root_folder = self.aruco_config.get('default_markers_folder', './ArUco')
         
+        # Cache des scans : le dossier de marqueurs peut être en lecture seule ou versionné
+        app_root = Path(getattr(config_manager, 'config_dir', Path(__file__).parent.parent / 'config')).resolve().parent
+        scan_cache_dir = Path(self.aruco_config.get('scan_cache_dir', DEFAULT_SCAN_CACHE_DIR))
+        self.scan_cache_dir = scan_cache_dir if scan_cache_dir.is_absolute() else app_root / scan_cache_dir
+        
     def get_latest_aruco_folder(self) -> Optional[str]:
         """Retourne le dossier ArUco le plus récent en cherchant dans les chemins possibles"""
         try:
@@ -102,6 +113,15 @@ class ArUcoConfigLoader:
         # Extensions supportées depuis config
         extensions = self.aruco_config.get('supported_extensions', ['.png', '.jpg', '.jpeg'])
         
+        # Manifeste à jour : pas de lecture des images. L'empreinte est prise avant le scan,
+        # un fichier modifié pendant le scan invalide donc le manifeste suivant.
+        fingerprint = self._folder_fingerprint(extensions)
+        cached_markers = self._load_scan_manifest(extensions, fingerprint)
+        if cached_markers is not None:
+            logger.info(f"ArUco: {len(cached_markers)} marqueurs chargés depuis le cache de scan")
+            self.detected_markers = cached_markers
+            return cached_markers
+        
         markers_found = {}
         total_files = 0
         processed_files = 0
@@ -142,8 +162,93 @@ class ArUcoConfigLoader:
                     marker['dictionary'] = detected_dict
         
         self.detected_markers = markers_found
+        self._save_scan_manifest(extensions, fingerprint, markers_found)
         return markers_found
     
+    def _scan_manifest_path(self, folder: Path) -> Path:
+        """Fichier manifeste du cache pour un dossier de marqueurs (clé : chemin absolu du dossier)"""
+        folder_key = hashlib.sha1(str(folder.resolve()).encode('utf-8')).hexdigest()
+        return self.scan_cache_dir / f"{folder_key}.json"
+    
+    def _folder_fingerprint(self, extensions: List[str]) -> Dict[str, List[int]]:
+        """Empreinte des fichiers scannés : nom → [mtime_ns, taille]
+        
+        Le mtime du dossier ne change pas quand une image est réécrite en place ;
+        seul un stat par fichier détecte cette modification.
+        """
+        suffixes = tuple(extensions)
+        fingerprint = {}
+        try:
+            with os.scandir(self.folder_path) as entries:
+                for entry in entries:
+                    # Mêmes fichiers que le glob du scan (*.ext, fichiers cachés exclus)
+                    if entry.name.startswith('.') or not entry.name.endswith(suffixes):
+                        continue
+                    if entry.is_file():
+                        stat = entry.stat()
+                        fingerprint[entry.name] = [stat.st_mtime_ns, stat.st_size]
+        except OSError as e:
+            logger.debug(f"⚠️ Empreinte dossier ArUco impossible: {e}")
+        return fingerprint
+    
+    def _load_scan_manifest(self, extensions: List[str], fingerprint: Dict[str, List[int]]) -> Optional[Dict]:
+        """Retourne les marqueurs du manifeste si aucun fichier n'a changé depuis le scan"""
+        manifest_path = self._scan_manifest_path(self.folder_path)
+        try:
+            if not manifest_path.exists():
+                return None
+            
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            
+            if (manifest.get('version') != SCAN_MANIFEST_VERSION
+                    or manifest.get('folder') != str(self.folder_path.resolve())
+                    or manifest.get('extensions') != list(extensions)
+                    or manifest.get('files') != fingerprint):
+                logger.debug("🔄 Manifeste ArUco obsolète, nouveau scan")
+                return None
+            
+            # Les clés JSON sont des chaînes : retour aux ID entiers
+            return {int(marker_id): info for marker_id, info in manifest.get('markers', {}).items()}
+            
+        except (OSError, ValueError, json.JSONDecodeError) as e:
+            logger.debug(f"⚠️ Manifeste ArUco illisible: {e}")
+            return None
+    
+    def _save_scan_manifest(self, extensions: List[str], fingerprint: Dict[str, List[int]], markers: Dict):
+        """Écrit le manifeste du scan dans le cache (dossier, extensions, empreinte des fichiers, marqueurs)
+        
+        Le dossier de marqueurs n'est jamais modifié ; un cache non inscriptible ou des
+        marqueurs non sérialisables sont ignorés.
+        """
+        manifest_path = self._scan_manifest_path(self.folder_path)
+        try:
+            manifest = {
+                'version': SCAN_MANIFEST_VERSION,
+                'folder': str(self.folder_path.resolve()),
+                'extensions': list(extensions),
+                'files': fingerprint,
+                'markers': markers
+            }
+            # Sérialisation complète avant ouverture : pas de manifeste tronqué sur TypeError
+            payload = json.dumps(manifest, ensure_ascii=False)
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"⚠️ Manifeste ArUco non écrit: {e}")
+    
+    def invalidate_scan_cache(self, folder_path: Optional[str] = None):
+        """Supprime le manifeste de scan pour forcer un parcours complet"""
+        folder = Path(folder_path) if folder_path else self.folder_path
+        if not folder:
+            return
+        try:
+            self._scan_manifest_path(folder).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"⚠️ Suppression manifeste ArUco impossible: {e}")
+    
     def _extract_marker_info(self, file_path: Path) -> Optional[Dict]:
         """Extrait les informations d'un marqueur depuis le nom de fichier - Version étendue"""
         filename = file_path.stem
@@ -181,6 +286,9 @@ class ArUcoConfigLoader:
                 groups = match.groups()
                 
                 try:
+                    # Un seul appel stat par fichier (métadonnées uniquement, jamais de décodage image)
+                    file_stat = file_path.stat()
+                    
                     # Traitement spécial pour le premier pattern (vos fichiers)
                     if i == 0:  # Pattern aruco_DICT_(\w+)_(\d+)
                         dict_type = groups[0].replace('_', 'X')  # 4X4_50 → 4X4_50
@@ -196,8 +304,8 @@ class ArUcoConfigLoader:
                             'enabled': True,
                             'detection_params': self._get_optimized_params(marker_id, size),
                             'pattern_used': i,
-                            'file_size_bytes': file_path.stat().st_size,
-                            'modification_time': file_path.stat().st_mtime
+                            'file_size_bytes': file_stat.st_size,
+                            'modification_time': file_stat.st_mtime
                         }
                         
                         logger.debug(f"✅ Pattern {i} réussi pour {filename}: ID={marker_id}, Dict={dict_type}")
@@ -218,8 +326,8 @@ class ArUcoConfigLoader:
                             'enabled': True,
                             'detection_params': self._get_optimized_params(marker_id, size),
                             'pattern_used': i,
-                            'file_size_bytes': file_path.stat().st_size,
-                            'modification_time': file_path.stat().st_mtime
+                            'file_size_bytes': file_stat.st_size,
+                            'modification_time': file_stat.st_mtime
                         }
                         
                         logger.debug(f"✅ Pattern {i} réussi pour {filename}: ID={marker_id}")
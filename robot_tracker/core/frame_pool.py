@@ -0,0 +1,60 @@
+# core/frame_pool.py
+# Version 1.0 - Réserve de buffers de frames
+# Modification: Création initiale (réutilisation des ndarray entre acquisition et détection)
+
+import threading
+import numpy as np
+from typing import List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class FramePool:
+    """Réserve de buffers uint8 pré-dimensionnés, partagée entre acquisition et détection"""
+
+    def __init__(self, shape: Optional[Tuple[int, ...]] = None, size: int = 4, dtype=np.uint8):
+        self._lock = threading.Lock()
+        self._dtype = np.dtype(dtype)
+        self._size = size
+        self._shape = tuple(shape) if shape is not None else None
+        self._free: List[np.ndarray] = []
+
+        if self._shape is not None:
+            self._free = [np.empty(self._shape, self._dtype) for _ in range(size)]
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Retourne un buffer libre de la forme demandée (alloué si la réserve est vide)"""
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+
+        with self._lock:
+            # Changement de résolution : les anciens buffers ne servent plus
+            if shape != self._shape or dtype != self._dtype:
+                logger.debug(f"🔄 FramePool redimensionné: {self._shape} → {shape}")
+                self._shape = shape
+                self._dtype = dtype
+                self._free.clear()
+
+            if self._free:
+                return self._free.pop()
+
+        return np.empty(shape, dtype)
+
+    def release(self, buf: np.ndarray):
+        """Rend un buffer à la réserve (ignoré si forme obsolète ou réserve pleine)"""
+        with self._lock:
+            if (buf.shape == self._shape and buf.dtype == self._dtype
+                    and len(self._free) < self._size):
+                self._free.append(buf)
+
+    def drain(self):
+        """Libère tous les buffers en réserve"""
+        with self._lock:
+            self._free.clear()
+
+    @property
+    def free_count(self) -> int:
+        """Nombre de buffers disponibles"""
+        with self._lock:
+            return len(self._free)
@@ -1,6 +1,6 @@
 # core/roi_manager.py
-# Version 1.0 - Gestionnaire de ROI interactives
-# Modification: Création initiale avec support rectangle et polygone
+# Version 1.1 - Filtrage ROI vectorisé
+# Modification: Masque des ROI actives en cache (cv2.fillPoly) et test de points vectorisé
 
 import cv2
 import numpy as np
@@ -59,6 +59,10 @@ class ROIManager:
         
         self.line_thickness = self.roi_config.get('line_thickness', 2)
         
+        # Masque des ROI actives (uint8 H×W), reconstruit seulement si les ROI changent
+        self._mask = None
+        self._mask_key = None
+        
         # Statistiques
         self.roi_stats = {
             'total_created': 0,
@@ -66,7 +70,7 @@ class ROIManager:
             'detections_in_roi': 0
         }
         
-        logger.info("📐 ROIManager v1.0 initialisé")
+        logger.info("📐 ROIManager v1.1 initialisé")
     
     def start_roi_creation(self, roi_type: ROIType, name: str = None):
         """Démarre la création d'une nouvelle ROI"""
@@ -283,6 +287,42 @@ class ROIManager:
     def _update_active_count(self):
         """Met à jour le compteur de ROI actives"""
         self.roi_stats['active_count'] = sum(1 for roi in self.rois if roi.active)
+        self.invalidate_mask()
+    
+    def invalidate_mask(self):
+        """Force la reconstruction du masque au prochain get_mask()"""
+        self._mask_key = None
+    
+    def get_mask(self, shape: Tuple[int, int]) -> np.ndarray:
+        """Masque uint8 (H, W) des ROI actives, mis en cache tant que les ROI ne changent pas"""
+        shape = tuple(shape[:2])
+        # Clé légère : détecte aussi les modifications faites directement sur self.rois
+        key = (shape, tuple((id(roi), roi.active, len(roi.points)) for roi in self.rois))
+        
+        if key != self._mask_key:
+            if self._mask is None or self._mask.shape != shape:
+                self._mask = np.zeros(shape, dtype=np.uint8)
+            else:
+                self._mask.fill(0)
+            
+            polygons = [np.array(roi.points, dtype=np.int32) for roi in self.rois
+                        if roi.active and len(roi.points) >= 3]
+            if polygons:
+                cv2.fillPoly(self._mask, polygons, 255)
+            self._mask_key = key
+        
+        return self._mask
+    
+    def points_in_active_rois(self, points: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+        """Test vectorisé : booléens (N,) pour des points (N, 2) entiers dans une image de forme shape"""
+        mask = self.get_mask(shape)
+        points = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+        x, y = points[:, 0], points[:, 1]
+        
+        inside = (x >= 0) & (x < mask.shape[1]) & (y >= 0) & (y < mask.shape[0])
+        keep = np.zeros(len(points), dtype=bool)
+        keep[inside] = mask[y[inside], x[inside]] != 0
+        return keep
     
     def draw_rois_on_frame(self, frame: np.ndarray) -> np.ndarray:
         """Dessine toutes les ROI sur un frame"""
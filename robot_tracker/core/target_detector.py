@@ -1,6 +1,6 @@
 # core/target_detector.py
-# Version 1.2 - Finalisation pour intégration TargetTab
-# Modification: Ajout des méthodes manquantes pour intégration complète
+# Version 1.16 - Verrou entre détection et réglages
+# Modification: detect_all_targets et les mutateurs (paramètres, dictionnaire, pas, activation, ROI) sérialisés par un RLock
 
 import cv2
 import numpy as np
@@ -8,10 +8,14 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 import logging
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Détections complètes mesurées par chemin (GPU et CPU) avant de trancher sur OpenCL
+_OPENCL_PROBE_SAMPLES = 4
+
 class TargetType(Enum):
     """Types de cibles supportées"""
     ARUCO = "aruco"
@@ -36,6 +40,10 @@ class TargetDetector:
     
     def __init__(self, config_manager):
         self.config = config_manager
+        # Détection (thread de l'exécuteur) et réglages (thread GUI) ne se chevauchent jamais :
+        # les mutateurs réinitialisent tables couleur et état de suivi lus pendant detect_all_targets
+        self._lock = threading.RLock()
+        
         # Utilisation du tracking_config.json existant
         self.target_config = self.config.get('tracking', 'target_detection', {})
         self.ui_config = self.config.get('tracking', 'target_tab_ui', {})
@@ -57,8 +65,34 @@ class TargetDetector:
         # Initialisation détecteurs
         self._init_aruco_detector()
         self._init_morphology_kernels()
+        self._init_color_ranges()
         self._init_kalman_filters()
         
+        # T-API OpenCV : UMat traité sur GPU OpenCL si disponible, ndarray sinon.
+        # Le réglage global (cv2.ocl.setUseOpenCL) est décidé une fois par l'application au démarrage ;
+        # ce détecteur le lit sans le modifier, son choix UMat/ndarray ne concerne que lui.
+        self.use_opencl = (bool(self.target_config.get('use_opencl', True))
+                           and cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL())
+        if self.use_opencl:
+            logger.info("✅ OpenCL actif pour la détection (cv2.UMat)")
+        # Mesure GPU/CPU sur les premières détections complètes, OpenCL coupé s'il est plus lent
+        self._opencl_probe = {True: [], False: []} if self.use_opencl else None
+        
+        # Détection puis suivi ArUco : flux optique Lucas-Kanade entre deux détections complètes
+        self.tracking_stride = max(1, int(self.aruco_config.get('tracking_stride', 1)))
+        self._lk_params = {
+            'winSize': (21, 21),
+            'maxLevel': 3,
+            'criteria': (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 30, 0.01)
+        }
+        self._aruco_prev_gray = None
+        self._aruco_last_corners = {}  # id → coins (4, 2) float32 de la dernière frame
+        self._aruco_frame_idx = 0
+        
+        # Niveaux de gris en ping-pong : la frame précédente reste intacte pour le flux optique
+        self._gray_bufs = [None, None]
+        self._gray_idx = 0
+        
         # Cache pour performances
         self._detection_cache = {}
         self._cache_timeout = 0.1  # 100ms
@@ -75,6 +109,10 @@ class TargetDetector:
     
     def _init_aruco_detector(self):
         """Initialise le détecteur ArUco avec compatibilité multi-versions OpenCV"""
+        # Détecteur construit une seule fois (dictionnaire + paramètres liés), réutilisé à chaque frame
+        self.aruco_detector = None
+        self.use_new_api = False
+        
         try:
             # Dictionnaire ArUco depuis config
             dict_name = self.aruco_config.get('dictionary_type', '4X4_50')
@@ -86,8 +124,7 @@ class TargetDetector:
                 self.aruco_dict = cv2.aruco.getPredefinedDictionary(dict_attr)
                 
                 # Paramètres de détection
-                self.aruco_params = cv2.aruco.DetectorParameters()
-                self._configure_aruco_params()
+                self.aruco_params = self._build_aruco_params()
                 
                 # Nouveau détecteur (OpenCV 4.7+)
                 if hasattr(cv2.aruco, 'ArucoDetector'):
@@ -105,28 +142,57 @@ class TargetDetector:
             logger.error(f"❌ Erreur initialisation ArUco: {e}")
             self.detection_enabled[TargetType.ARUCO] = False
     
-    def _configure_aruco_params(self):
-        """Configure les paramètres de détection ArUco depuis la config"""
+    def _build_aruco_params(self):
+        """Crée un nouvel objet DetectorParameters configuré depuis la config (jamais partagé avec un détecteur actif)"""
         params_config = self.aruco_config.get('detection_params', {})
+        params = cv2.aruco.DetectorParameters()
         
         # Seuillage adaptatif
-        self.aruco_params.adaptiveThreshWinSizeMin = params_config.get('adaptiveThreshWinSizeMin', 3)
-        self.aruco_params.adaptiveThreshWinSizeMax = params_config.get('adaptiveThreshWinSizeMax', 23)
+        params.adaptiveThreshWinSizeMin = params_config.get('adaptiveThreshWinSizeMin', 3)
+        params.adaptiveThreshWinSizeMax = params_config.get('adaptiveThreshWinSizeMax', 23)
         
         # Périmètre des marqueurs
-        self.aruco_params.minMarkerPerimeterRate = params_config.get('minMarkerPerimeterRate', 0.1)
-        self.aruco_params.maxMarkerPerimeterRate = params_config.get('maxMarkerPerimeterRate', 4.0)
+        params.minMarkerPerimeterRate = params_config.get('minMarkerPerimeterRate', 0.1)
+        params.maxMarkerPerimeterRate = params_config.get('maxMarkerPerimeterRate', 4.0)
         
         # Précision polygonale
-        self.aruco_params.polygonalApproxAccuracyRate = params_config.get('polygonalApproxAccuracyRate', 0.03)
+        params.polygonalApproxAccuracyRate = params_config.get('polygonalApproxAccuracyRate', 0.03)
         
         logger.debug("🔧 Paramètres ArUco configurés depuis JSON")
+        return params
     
     def _init_morphology_kernels(self):
         """Initialise les kernels de morphologie pour marqueurs réfléchissants"""
         kernel_size = self.reflective_config.get('morphology', {}).get('kernel_size', 5)
         self.morph_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (kernel_size, kernel_size))
         
+    def _init_color_ranges(self):
+        """Pré-calcule les bornes HSV (uint8) des détecteurs couleur, une fois pour toutes"""
+        hsv_ranges = self.reflective_config.get('hsv_ranges', {})
+        self._reflective_bounds = (
+            np.array(hsv_ranges.get('lower', [0, 0, 200]), dtype=np.uint8),
+            np.array(hsv_ranges.get('upper', [180, 30, 255]), dtype=np.uint8)
+        )
+        
+        # Une liste de plages par couleur (le rouge boucle sur la teinte via secondary_h)
+        self._led_color_bounds = {}
+        for color_name, color_ranges in self.led_config.get('color_presets', {}).items():
+            h_range = color_ranges.get('h', color_ranges.get('h_range', [0, 180]))
+            s_range = color_ranges.get('s', color_ranges.get('s_range', [50, 255]))
+            v_range = color_ranges.get('v', color_ranges.get('v_range', [50, 255]))
+            
+            bounds = [(
+                np.array([h_range[0], s_range[0], v_range[0]], dtype=np.uint8),
+                np.array([h_range[1], s_range[1], v_range[1]], dtype=np.uint8)
+            )]
+            secondary_h = color_ranges.get('secondary_h')
+            if secondary_h:
+                bounds.append((
+                    np.array([secondary_h[0], s_range[0], v_range[0]], dtype=np.uint8),
+                    np.array([secondary_h[1], s_range[1], v_range[1]], dtype=np.uint8)
+                ))
+            self._led_color_bounds[color_name] = bounds
+    
     def _init_kalman_filters(self):
         """Initialise les filtres de Kalman pour stabilisation"""
         self.kalman_filters = {}  # Un filtre par cible trackée
@@ -134,12 +200,69 @@ class TargetDetector:
     
     def set_roi(self, roi):
         """Définit la ROI active pour filtrer les détections"""
-        self.active_roi = roi
+        with self._lock:
+            self.active_roi = roi
         logger.info(f"📐 ROI active définie: {type(roi).__name__ if roi else 'Aucune'}")
     
+    def update_detection_params(self, target_type: TargetType, params: Dict):
+        """Met à jour les paramètres d'un détecteur
+        
+        ArUco : nouveaux DetectorParameters et nouvel ArucoDetector, échangés en une affectation ;
+        un detectMarkers en cours sur le thread de détection (GIL relâché) garde l'ancien objet.
+        """
+        with self._lock:
+            try:
+                if target_type == TargetType.ARUCO:
+                    current = self.aruco_config.setdefault('detection_params', {})
+                    if all(current.get(key) == value for key, value in params.items()):
+                        return  # Paramètres identiques : le détecteur existant reste valable
+                    current.update(params)
+                    if hasattr(self, 'aruco_params'):
+                        aruco_params = self._build_aruco_params()
+                        if self.aruco_detector is not None:
+                            self.aruco_detector = cv2.aruco.ArucoDetector(self.aruco_dict, aruco_params)
+                        self.aruco_params = aruco_params
+                elif target_type == TargetType.REFLECTIVE:
+                    self.reflective_config.update(params)
+                    self._init_color_ranges()
+                elif target_type == TargetType.LED:
+                    self.led_config.update(params)
+                    self._init_color_ranges()
+                
+                logger.info(f"🔧 Paramètres {target_type.value} mis à jour")
+                
+            except Exception as e:
+                logger.error(f"❌ Erreur mise à jour paramètres {target_type}: {e}")
+    
+    def set_aruco_dictionary(self, dict_name: str):
+        """Change le dictionnaire ArUco via un nouveau détecteur échangé en une affectation (jamais setDictionary en place)"""
+        with self._lock:
+            if dict_name == self.aruco_config.get('dictionary_type') and hasattr(self, 'aruco_dict'):
+                return
+            
+            self.aruco_config['dictionary_type'] = dict_name
+            if self.aruco_detector is None:
+                # Ancienne API ou ArUco indisponible : initialisation complète
+                self._init_aruco_detector()
+                return
+            
+            try:
+                dict_attr = getattr(cv2.aruco, f'DICT_{dict_name}', cv2.aruco.DICT_4X4_50)
+                aruco_dict = cv2.aruco.getPredefinedDictionary(dict_attr)
+                self.aruco_detector = cv2.aruco.ArucoDetector(aruco_dict, self.aruco_params)
+                self.aruco_dict = aruco_dict
+                
+                # Coins suivis obtenus avec l'ancien dictionnaire : suivi repris à zéro
+                self._aruco_last_corners = {}
+                logger.info(f"🎯 Dictionnaire ArUco: {dict_name}")
+                
+            except Exception as e:
+                logger.error(f"❌ Erreur changement dictionnaire ArUco: {e}")
+    
     def set_detection_enabled(self, target_type: TargetType, enabled: bool):
         """Active/désactive la détection pour un type de cible"""
-        self.detection_enabled[target_type] = enabled
+        with self._lock:
+            self.detection_enabled[target_type] = enabled
         logger.info(f"🔍 Détection {target_type.value}: {'Activée' if enabled else 'Désactivée'}")
     
     def detect_all_targets(self, frame: np.ndarray) -> List[DetectionResult]:
@@ -150,37 +273,38 @@ class TargetDetector:
         start_time = time.time()
         all_detections = []
         
-        try:
-            # Application ROI si définie
-            roi_frame = self._apply_roi_mask(frame) if self.active_roi else frame
-            
-            # Détection ArUco
-            if self.detection_enabled[TargetType.ARUCO]:
-                aruco_detections = self._detect_aruco_markers(roi_frame)
-                all_detections.extend(aruco_detections)
-            
-            # Détection marqueurs réfléchissants
-            if self.detection_enabled[TargetType.REFLECTIVE]:
-                reflective_detections = self._detect_reflective_markers(roi_frame)
-                all_detections.extend(reflective_detections)
-            
-            # Détection LEDs colorées
-            if self.detection_enabled[TargetType.LED]:
-                led_detections = self._detect_led_markers(roi_frame)
-                all_detections.extend(led_detections)
-            
-            # Filtrage Kalman si configuré
-            if self.kalman_config.get('enabled', False):
-                all_detections = self._apply_kalman_filtering(all_detections)
-            
-            # Mise à jour statistiques
-            self._update_detection_stats(all_detections, time.time() - start_time)
-            
-            return all_detections
-            
-        except Exception as e:
-            logger.error(f"❌ Erreur détection globale: {e}")
-            return []
+        with self._lock:
+            try:
+                # Application ROI si définie
+                roi_frame = self._apply_roi_mask(frame) if self.active_roi else frame
+                
+                # Détection ArUco
+                if self.detection_enabled[TargetType.ARUCO]:
+                    aruco_detections = self._detect_aruco_markers(roi_frame)
+                    all_detections.extend(aruco_detections)
+                
+                # Détection marqueurs réfléchissants
+                if self.detection_enabled[TargetType.REFLECTIVE]:
+                    reflective_detections = self._detect_reflective_markers(roi_frame)
+                    all_detections.extend(reflective_detections)
+                
+                # Détection LEDs colorées
+                if self.detection_enabled[TargetType.LED]:
+                    led_detections = self._detect_led_markers(roi_frame)
+                    all_detections.extend(led_detections)
+                
+                # Filtrage Kalman si configuré
+                if self.kalman_config.get('enabled', False):
+                    all_detections = self._apply_kalman_filtering(all_detections)
+                
+                # Mise à jour statistiques
+                self._update_detection_stats(all_detections, time.time() - start_time)
+                
+                return all_detections
+                
+            except Exception as e:
+                logger.error("❌ Erreur détection globale: %s", e)
+                return []
     
     def _apply_roi_mask(self, frame: np.ndarray) -> np.ndarray:
         """Applique le masque ROI au frame"""
@@ -188,52 +312,165 @@ class TargetDetector:
         # Pour l'instant, retour du frame complet
         return frame
     
+    def set_tracking_stride(self, stride: int):
+        """Fixe K : détection ArUco complète une frame sur K, flux optique entre les deux"""
+        with self._lock:
+            self.tracking_stride = max(1, int(stride))
+            self._aruco_last_corners = {}
+            self._aruco_prev_gray = None
+            self._aruco_frame_idx = 0
+        logger.info(f"🔧 Pas de détection ArUco complète: 1/{self.tracking_stride}")
+    
     def _detect_aruco_markers(self, frame: np.ndarray) -> List[DetectionResult]:
-        """Détection des marqueurs ArUco"""
+        """Détection des marqueurs ArUco (suivi par flux optique entre détections complètes)"""
         detections = []
         
         try:
-            if self.use_new_api and hasattr(self, 'aruco_detector'):
-                # Nouvelle API OpenCV 4.7+
-                corners, ids, _ = self.aruco_detector.detectMarkers(frame)
+            # Conversion unique en niveaux de gris (évite la conversion interne du détecteur)
+            gray = self._next_gray_buffer(frame.shape[:2])
+            if frame.ndim == 3:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
             else:
-                # Ancienne API
-                corners, ids, _ = cv2.aruco.detectMarkers(
-                    frame, self.aruco_dict, parameters=self.aruco_params
-                )
+                np.copyto(gray, frame)
             
-            if ids is not None and len(ids) > 0:
-                for i, marker_id in enumerate(ids.flatten()):
-                    corner_points = corners[i][0]
-                    
-                    # Calcul du centre
-                    center = tuple(map(int, corner_points.mean(axis=0)))
-                    
-                    # Calcul de la taille (aire du marqueur)
-                    area = cv2.contourArea(corner_points)
-                    size = np.sqrt(area)
-                    
-                    # Calcul de la rotation
-                    rotation = self._calculate_marker_rotation(corner_points)
-                    
-                    detection = DetectionResult(
-                        target_type=TargetType.ARUCO,
-                        id=int(marker_id),
-                        center=center,
-                        corners=[tuple(map(int, pt)) for pt in corner_points],
-                        confidence=0.9,  # Confiance élevée pour ArUco
-                        size=size,
-                        rotation=rotation,
-                        timestamp=time.time()
-                    )
-                    
-                    detections.append(detection)
+            # Suivi des coins sur les frames intermédiaires, détection complète sinon
+            tracked = None
+            if (self.tracking_stride > 1 and self._aruco_last_corners
+                    and self._aruco_frame_idx % self.tracking_stride != 0
+                    and self._aruco_prev_gray is not None
+                    and self._aruco_prev_gray.shape == gray.shape):
+                tracked = self._track_aruco_corners(gray)
+            self._aruco_frame_idx += 1
+            
+            if tracked is not None:
+                marker_ids, marker_corners = tracked
+                confidence = 0.8  # Coins suivis, non re-détectés
+            else:
+                marker_ids, marker_corners = self._detect_aruco_corners(gray)
+                confidence = 0.9  # Confiance élevée pour ArUco
+            
+            self._aruco_prev_gray = gray
+            self._aruco_last_corners = dict(zip(marker_ids, marker_corners))
+            
+            timestamp = time.time()
+            for marker_id, corner_points in zip(marker_ids, marker_corners):
+                # Calcul du centre
+                center = tuple(map(int, corner_points.mean(axis=0)))
+                
+                # Calcul de la taille (aire du marqueur)
+                area = cv2.contourArea(corner_points)
+                size = np.sqrt(area)
+                
+                # Calcul de la rotation
+                rotation = self._calculate_marker_rotation(corner_points)
+                
+                detection = DetectionResult(
+                    target_type=TargetType.ARUCO,
+                    id=marker_id,
+                    center=center,
+                    corners=[tuple(map(int, pt)) for pt in corner_points],
+                    confidence=confidence,
+                    size=size,
+                    rotation=rotation,
+                    timestamp=timestamp,
+                    additional_data={'tracked': tracked is not None}
+                )
+                
+                detections.append(detection)
                     
         except Exception as e:
-            logger.error(f"❌ Erreur détection ArUco: {e}")
+            logger.error("❌ Erreur détection ArUco: %s", e)
         
         return detections
     
+    def _next_gray_buffer(self, shape: Tuple[int, int]) -> np.ndarray:
+        """Retourne le buffer niveaux de gris libre (alloué seulement au changement de taille)"""
+        self._gray_idx ^= 1
+        buf = self._gray_bufs[self._gray_idx]
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            self._gray_bufs[self._gray_idx] = buf
+        return buf
+    
+    def _detect_aruco_corners(self, gray: np.ndarray) -> Tuple[List[int], List[np.ndarray]]:
+        """Détection ArUco complète : (ids, coins (4, 2) float32)"""
+        # Seuillage/contours déportés sur le GPU via la T-API si OpenCL est actif
+        if self._opencl_probe is not None:
+            # Étalonnage : détections alternées GPU/CPU
+            on_gpu = len(self._opencl_probe[True]) <= len(self._opencl_probe[False])
+            start = cv2.getTickCount()
+            corners, ids = self._run_aruco_detect(cv2.UMat(gray) if on_gpu else gray)
+            self._record_opencl_probe(on_gpu, cv2.getTickCount() - start)
+        else:
+            corners, ids = self._run_aruco_detect(cv2.UMat(gray) if self.use_opencl else gray)
+        
+        # Sorties UMat ramenées en ndarray pour le post-traitement CPU
+        if isinstance(ids, cv2.UMat):
+            ids = ids.get()
+        if ids is None or len(ids) == 0:
+            return [], []
+        
+        corners = [c.get() if isinstance(c, cv2.UMat) else c for c in corners]
+        return [int(marker_id) for marker_id in ids.flatten()], [c.reshape(4, 2) for c in corners]
+    
+    def _run_aruco_detect(self, source):
+        """Appel brut du détecteur ArUco sur un ndarray ou un UMat : (coins, ids)"""
+        # Référence locale : un échange concurrent du détecteur ne touche pas cet appel
+        aruco_detector = self.aruco_detector
+        if aruco_detector is not None:
+            # Nouvelle API OpenCV 4.7+
+            corners, ids, _ = aruco_detector.detectMarkers(source)
+        else:
+            # Ancienne API
+            corners, ids, _ = cv2.aruco.detectMarkers(
+                source, self.aruco_dict, parameters=self.aruco_params
+            )
+        return corners, ids
+    
+    def _record_opencl_probe(self, on_gpu: bool, ticks: int):
+        """Enregistre une mesure d'étalonnage et tranche GPU/CPU après _OPENCL_PROBE_SAMPLES de chaque"""
+        self._opencl_probe[on_gpu].append(ticks)
+        if min(len(samples) for samples in self._opencl_probe.values()) < _OPENCL_PROBE_SAMPLES:
+            return
+        
+        # Première mesure GPU écartée : elle inclut la compilation des noyaux OpenCL
+        gpu_ticks = float(np.median(self._opencl_probe[True][1:]))
+        cpu_ticks = float(np.median(self._opencl_probe[False]))
+        self._opencl_probe = None
+        
+        if gpu_ticks >= cpu_ticks:
+            # Repli ndarray pour ce détecteur seulement : le réglage OpenCL global n'est pas touché
+            self.use_opencl = False
+            logger.info(f"🔧 UMat abandonné pour la détection: plus lent que le CPU ({gpu_ticks / cpu_ticks:.2f}×)")
+        else:
+            logger.info(f"✅ OpenCL conservé: {cpu_ticks / gpu_ticks:.2f}× plus rapide que le CPU")
+    
+    def _track_aruco_corners(self, gray: np.ndarray) -> Optional[Tuple[List[int], List[np.ndarray]]]:
+        """Suit les coins connus par Lucas-Kanade ; None si un marqueur est perdu"""
+        marker_ids = list(self._aruco_last_corners.keys())
+        prev_pts = np.concatenate(
+            [self._aruco_last_corners[marker_id] for marker_id in marker_ids]
+        ).reshape(-1, 1, 2).astype(np.float32)
+        
+        next_pts, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._aruco_prev_gray, gray, prev_pts, None, **self._lk_params
+        )
+        if next_pts is None or status is None:
+            return None
+        
+        # Un marqueur n'est conservé que si ses 4 coins ont été suivis
+        if not status.reshape(-1, 4).all(axis=1).all():
+            logger.debug("🔄 Suivi ArUco perdu, détection complète")
+            return None
+        
+        # Coins suivis dégénérés (quadrilatère croisé ou concave) : détection complète
+        quads = next_pts.reshape(-1, 4, 2)
+        if not self._convex_quad_mask(quads).all():
+            logger.debug("🔄 Quadrilatère ArUco suivi non convexe, détection complète")
+            return None
+        
+        return marker_ids, list(quads)
+    
     def _detect_reflective_markers(self, frame: np.ndarray) -> List[DetectionResult]:
         """Détection des marqueurs réfléchissants"""
         detections = []
@@ -243,10 +480,7 @@ class TargetDetector:
             hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
             
             # Seuillage pour marqueurs réfléchissants (valeurs élevées)
-            hsv_ranges = self.reflective_config.get('hsv_ranges', {})
-            lower = np.array(hsv_ranges.get('lower', [0, 0, 200]))
-            upper = np.array(hsv_ranges.get('upper', [180, 30, 255]))
-            
+            lower, upper = self._reflective_bounds
             mask = cv2.inRange(hsv, lower, upper)
             
             # Morphologie pour nettoyer
@@ -262,47 +496,52 @@ class TargetDetector:
             max_area = filters.get('max_area', 5000)
             min_circularity = filters.get('min_circularity', 0.7)
             
-            for i, contour in enumerate(contours):
-                area = cv2.contourArea(contour)
+            # Pré-filtrage par aire en un bloc NumPy : le reste ne traite que les candidats
+            areas = self._contour_areas(contours)
+            candidates = np.flatnonzero((areas >= min_area) & (areas <= max_area))
+            timestamp = time.time()
+            
+            for i in candidates:
+                contour = contours[i]
+                area = float(areas[i])
                 
-                if min_area <= area <= max_area:
-                    # Test de circularité
-                    perimeter = cv2.arcLength(contour, True)
-                    if perimeter > 0:
-                        circularity = 4 * np.pi * area / (perimeter * perimeter)
-                        
-                        if circularity >= min_circularity:
-                            # Calcul du centre
-                            M = cv2.moments(contour)
-                            if M['m00'] > 0:
-                                cx = int(M['m10'] / M['m00'])
-                                cy = int(M['m01'] / M['m00'])
-                                
-                                # Approximation rectangulaire pour corners
-                                rect = cv2.boundingRect(contour)
-                                corners = [
-                                    (rect[0], rect[1]),
-                                    (rect[0] + rect[2], rect[1]),
-                                    (rect[0] + rect[2], rect[1] + rect[3]),
-                                    (rect[0], rect[1] + rect[3])
-                                ]
-                                
-                                detection = DetectionResult(
-                                    target_type=TargetType.REFLECTIVE,
-                                    id=i,  # ID basé sur l'ordre de détection
-                                    center=(cx, cy),
-                                    corners=corners,
-                                    confidence=circularity,
-                                    size=np.sqrt(area),
-                                    rotation=0.0,
-                                    timestamp=time.time(),
-                                    additional_data={'area': area, 'circularity': circularity}
-                                )
-                                
-                                detections.append(detection)
+                # Test de circularité
+                perimeter = cv2.arcLength(contour, True)
+                if perimeter > 0:
+                    circularity = 4 * np.pi * area / (perimeter * perimeter)
+                    
+                    if circularity >= min_circularity:
+                        # Calcul du centre
+                        M = cv2.moments(contour)
+                        if M['m00'] > 0:
+                            cx = int(M['m10'] / M['m00'])
+                            cy = int(M['m01'] / M['m00'])
+                            
+                            # Approximation rectangulaire pour corners
+                            rect = cv2.boundingRect(contour)
+                            corners = [
+                                (rect[0], rect[1]),
+                                (rect[0] + rect[2], rect[1]),
+                                (rect[0] + rect[2], rect[1] + rect[3]),
+                                (rect[0], rect[1] + rect[3])
+                            ]
+                            
+                            detection = DetectionResult(
+                                target_type=TargetType.REFLECTIVE,
+                                id=int(i),  # ID basé sur l'ordre de détection
+                                center=(cx, cy),
+                                corners=corners,
+                                confidence=circularity,
+                                size=np.sqrt(area),
+                                rotation=0.0,
+                                timestamp=timestamp,
+                                additional_data={'area': area, 'circularity': circularity}
+                            )
+                            
+                            detections.append(detection)
                                 
         except Exception as e:
-            logger.error(f"❌ Erreur détection marqueurs réfléchissants: {e}")
+            logger.error("❌ Erreur détection marqueurs réfléchissants: %s", e)
         
         return detections
     
@@ -318,61 +557,72 @@ class TargetDetector:
             gaussian_kernel = self.led_config.get('gaussian_blur_kernel', 5)
             hsv = cv2.GaussianBlur(hsv, (gaussian_kernel, gaussian_kernel), 0)
             
-            # Détection par couleur
-            color_presets = self.led_config.get('color_presets', {})
+            timestamp = time.time()
             
-            for color_name, color_ranges in color_presets.items():
-                # Seuillage couleur
-                h_range = color_ranges.get('h', [0, 180])
-                s_range = color_ranges.get('s', [50, 255])
-                v_range = color_ranges.get('v', [50, 255])
-                
-                lower = np.array([h_range[0], s_range[0], v_range[0]])
-                upper = np.array([h_range[1], s_range[1], v_range[1]])
-                
+            # Détection par couleur : un cv2.inRange par plage, fusion vectorisée
+            for color_name, bounds in self._led_color_bounds.items():
+                lower, upper = bounds[0]
                 mask = cv2.inRange(hsv, lower, upper)
+                for lower, upper in bounds[1:]:
+                    cv2.bitwise_or(mask, cv2.inRange(hsv, lower, upper), dst=mask)
                 
                 # Recherche de contours
                 contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
                 
-                for i, contour in enumerate(contours):
-                    area = cv2.contourArea(contour)
+                # Pré-filtrage par aire en un bloc NumPy
+                areas = self._contour_areas(contours)
+                
+                for i in np.flatnonzero(areas > 20):  # Filtre taille minimale
+                    contour = contours[i]
+                    area = float(areas[i])
                     
-                    if area > 20:  # Filtre taille minimale
-                        # Centre pondéré par intensité
-                        M = cv2.moments(contour)
-                        if M['m00'] > 0:
-                            cx = int(M['m10'] / M['m00'])
-                            cy = int(M['m01'] / M['m00'])
-                            
-                            # Rectangle englobant pour corners
-                            rect = cv2.boundingRect(contour)
-                            corners = [
-                                (rect[0], rect[1]),
-                                (rect[0] + rect[2], rect[1]),
-                                (rect[0] + rect[2], rect[1] + rect[3]),
-                                (rect[0], rect[1] + rect[3])
-                            ]
-                            
-                            detection = DetectionResult(
-                                target_type=TargetType.LED,
-                                id=hash(color_name) % 1000,  # ID basé sur la couleur
-                                center=(cx, cy),
-                                corners=corners,
-                                confidence=min(area / 1000.0, 1.0),
-                                size=np.sqrt(area),
-                                rotation=0.0,
-                                timestamp=time.time(),
-                                additional_data={'color': color_name, 'area': area}
-                            )
-                            
-                            detections.append(detection)
+                    # Centre pondéré par intensité
+                    M = cv2.moments(contour)
+                    if M['m00'] > 0:
+                        cx = int(M['m10'] / M['m00'])
+                        cy = int(M['m01'] / M['m00'])
+                        
+                        # Rectangle englobant pour corners
+                        rect = cv2.boundingRect(contour)
+                        corners = [
+                            (rect[0], rect[1]),
+                            (rect[0] + rect[2], rect[1]),
+                            (rect[0] + rect[2], rect[1] + rect[3]),
+                            (rect[0], rect[1] + rect[3])
+                        ]
+                        
+                        detection = DetectionResult(
+                            target_type=TargetType.LED,
+                            id=hash(color_name) % 1000,  # ID basé sur la couleur
+                            center=(cx, cy),
+                            corners=corners,
+                            confidence=min(area / 1000.0, 1.0),
+                            size=np.sqrt(area),
+                            rotation=0.0,
+                            timestamp=timestamp,
+                            additional_data={'color': color_name, 'area': area}
+                        )
+                        
+                        detections.append(detection)
                             
         except Exception as e:
-            logger.error(f"❌ Erreur détection LEDs: {e}")
+            logger.error("❌ Erreur détection LEDs: %s", e)
         
         return detections
     
+    @staticmethod
+    def _convex_quad_mask(quads: np.ndarray) -> np.ndarray:
+        """Masque des quadrilatères (N, 4, 2) convexes : produits vectoriels de même signe"""
+        edges = np.roll(quads, -1, axis=1) - quads            # Côtés p[i+1] - p[i]
+        next_edges = np.roll(edges, -1, axis=1)
+        cross = edges[..., 0] * next_edges[..., 1] - edges[..., 1] * next_edges[..., 0]
+        return (cross > 0).all(axis=1) | (cross < 0).all(axis=1)
+    
+    @staticmethod
+    def _contour_areas(contours) -> np.ndarray:
+        """Aires de tous les contours dans un tableau NumPy (filtrage vectorisé ensuite)"""
+        return np.fromiter((cv2.contourArea(c) for c in contours), dtype=np.float64, count=len(contours))
+    
     def _calculate_marker_rotation(self, corners: np.ndarray) -> float:
         """Calcule l'angle de rotation d'un marqueur ArUco"""
         try:
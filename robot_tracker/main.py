@@ -1,6 +1,6 @@
 # robot_tracker/main.py
-# Version 1.2 - Correction suppression complète logs OpenCV et configuration
-# Modification: Suppression AVANT chargement config + redirection stderr OpenCV
+# Version 1.3 - Choix OpenCL global au démarrage
+# Modification: cv2.ocl.setUseOpenCL décidé une fois depuis tracking.target_detection.use_opencl
 
 import sys
 import logging
@@ -76,6 +76,21 @@ def setup_logging_directory():
         logs_dir.mkdir(exist_ok=True)
 
 
+def setup_opencl(config: ConfigManager) -> bool:
+    """Active ou non la T-API OpenCL d'OpenCV pour tout le processus (une seule fois, au démarrage)
+    
+    Réglage global : les détecteurs choisissent ensuite eux-mêmes UMat ou ndarray
+    sans jamais modifier ce choix.
+    """
+    try:
+        import cv2
+        use_opencl = bool(config.get('tracking', 'target_detection.use_opencl', True)) and cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(use_opencl)
+        return use_opencl
+    except (ImportError, AttributeError):
+        return False
+
+
 def main():
     """Point d'entrée principal de l'application"""
     
@@ -143,6 +158,11 @@ def main():
             available_levels = config.get_available_verbosity_levels()
             logger.debug(f"🔧 Niveaux disponibles: {available_levels}")
     
+    # ÉTAPE 8b: Choix OpenCL global, avant la création des détecteurs
+    use_opencl = setup_opencl(config)
+    if verbosity == "Debug":
+        logger.debug(f"🔧 OpenCL (T-API) actif: {use_opencl}")
+    
     # ÉTAPE 9: Création de l'application PyQt6
     app = QApplication(sys.argv)
     
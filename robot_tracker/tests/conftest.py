@@ -0,0 +1,8 @@
+# robot_tracker/tests/conftest.py
+# Version 1.0 - Configuration pytest des tests unitaires
+# Modification: Création initiale (robot_tracker dans sys.path, imports core/utils comme l'application)
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
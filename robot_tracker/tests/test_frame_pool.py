@@ -0,0 +1,63 @@
+# robot_tracker/tests/test_frame_pool.py
+# Version 1.0 - Tests de la réserve de buffers de frames
+# Modification: Création initiale (réutilisation, changement de forme, capacité, vidage)
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.frame_pool import FramePool
+
+
+def test_preallocated_buffers_are_reused():
+    pool = FramePool((4, 6, 3), size=2)
+    assert pool.free_count == 2
+    
+    buf = pool.acquire((4, 6, 3))
+    assert buf.shape == (4, 6, 3) and buf.dtype == np.uint8
+    assert pool.free_count == 1
+    
+    pool.release(buf)
+    assert pool.free_count == 2
+    assert pool.acquire((4, 6, 3)) is buf
+
+
+def test_empty_pool_allocates():
+    pool = FramePool()
+    buf = pool.acquire((2, 3), np.float32)
+    assert buf.shape == (2, 3) and buf.dtype == np.float32
+    assert pool.free_count == 0
+
+
+def test_shape_change_discards_stale_buffers():
+    pool = FramePool((4, 6, 3), size=2)
+    old = pool.acquire((4, 6, 3))
+    
+    new = pool.acquire((8, 12, 3))
+    assert new.shape == (8, 12, 3)
+    assert pool.free_count == 0
+    
+    # Buffer de l'ancienne résolution : refusé par la réserve
+    pool.release(old)
+    assert pool.free_count == 0
+    pool.release(new)
+    assert pool.free_count == 1
+
+
+def test_dtype_change_discards_stale_buffers():
+    pool = FramePool((4, 6), size=2)
+    pool.acquire((4, 6), np.uint16)
+    assert pool.free_count == 0
+
+
+def test_release_is_capped_at_pool_size():
+    pool = FramePool((2, 2), size=1)
+    extra = np.empty((2, 2), np.uint8)
+    pool.release(extra)
+    assert pool.free_count == 1
+
+
+def test_drain_empties_the_pool():
+    pool = FramePool((2, 2), size=3)
+    pool.drain()
+    assert pool.free_count == 0
@@ -0,0 +1,72 @@
+# robot_tracker/tests/test_roi_manager.py
+# Version 1.0 - Tests du masque des ROI actives
+# Modification: Création initiale (get_mask en cache, points_in_active_rois vectorisé)
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from core.roi_manager import ROI, ROIManager, ROIType
+
+
+class _Config:
+    """ConfigManager minimal : valeurs par défaut uniquement"""
+    
+    def get(self, section, key, default=None):
+        return default
+
+
+def _manager(*rois):
+    manager = ROIManager(_Config())
+    manager.rois.extend(rois)
+    return manager
+
+
+def _square(x0, y0, x1, y1, active=True):
+    return ROI(ROIType.RECTANGLE, [(x0, y0), (x1, y0), (x1, y1), (x0, y1)], 'square', active=active)
+
+
+def test_mask_covers_active_polygons_only():
+    manager = _manager(_square(2, 2, 5, 5), _square(10, 10, 15, 15, active=False))
+    mask = manager.get_mask((20, 30, 3))
+    
+    assert mask.shape == (20, 30) and mask.dtype == np.uint8
+    assert mask[3, 3] == 255
+    assert mask[12, 12] == 0
+    assert mask[0, 0] == 0
+
+
+def test_mask_is_cached_until_rois_change():
+    square = _square(2, 2, 5, 5)
+    manager = _manager(square)
+    first = manager.get_mask((20, 30))
+    assert manager.get_mask((20, 30)) is first
+    
+    # Désactivation faite directement sur la ROI : vue par la clé du cache
+    square.active = False
+    assert manager.get_mask((20, 30))[3, 3] == 0
+
+
+def test_mask_follows_frame_size():
+    manager = _manager(_square(2, 2, 5, 5))
+    assert manager.get_mask((20, 30)).shape == (20, 30)
+    assert manager.get_mask((40, 60)).shape == (40, 60)
+
+
+def test_roi_with_too_few_points_is_ignored():
+    manager = _manager(ROI(ROIType.POLYGON, [(1, 1), (8, 8)], 'line'))
+    assert not manager.get_mask((10, 10)).any()
+
+
+def test_points_in_active_rois():
+    manager = _manager(_square(2, 2, 5, 5))
+    points = np.array([[3, 3], [0, 0], [5, 5], [-1, 3], [3, 40], [29, 19]])
+    
+    inside = manager.points_in_active_rois(points, (20, 30))
+    assert inside.tolist() == [True, False, True, False, False, False]
+
+
+def test_points_in_active_rois_accepts_empty_input():
+    manager = _manager(_square(2, 2, 5, 5))
+    assert manager.points_in_active_rois(np.empty((0, 2)), (20, 30)).shape == (0,)
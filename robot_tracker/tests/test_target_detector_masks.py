@@ -0,0 +1,40 @@
+# robot_tracker/tests/test_target_detector_masks.py
+# Version 1.0 - Tests des filtres vectorisés du détecteur de cibles
+# Modification: Création initiale (_convex_quad_mask)
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from core.target_detector import TargetDetector
+
+
+def _quads(*quads):
+    return np.array(quads, dtype=np.float32)
+
+
+def test_convex_quads_in_both_orientations():
+    square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    mask = TargetDetector._convex_quad_mask(_quads(square, square[::-1]))
+    assert mask.tolist() == [True, True]
+
+
+def test_concave_and_self_intersecting_quads_are_rejected():
+    concave = [(0, 0), (10, 0), (3, 3), (0, 10)]
+    bow_tie = [(0, 0), (10, 10), (10, 0), (0, 10)]
+    mask = TargetDetector._convex_quad_mask(_quads(concave, bow_tie))
+    assert mask.tolist() == [False, False]
+
+
+def test_degenerate_quad_is_rejected():
+    # Trois points alignés : produit vectoriel nul
+    collinear = [(0, 0), (5, 0), (10, 0), (0, 10)]
+    assert TargetDetector._convex_quad_mask(_quads(collinear)).tolist() == [False]
+
+
+def test_mixed_batch_keeps_order():
+    square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    concave = [(0, 0), (10, 0), (3, 3), (0, 10)]
+    mask = TargetDetector._convex_quad_mask(_quads(concave, square, concave))
+    assert mask.tolist() == [False, True, False]
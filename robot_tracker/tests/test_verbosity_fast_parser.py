@@ -0,0 +1,44 @@
+# robot_tracker/tests/test_verbosity_fast_parser.py
+# Version 1.0 - Tests de la lecture directe des arguments de l'outil de verbosité
+# Modification: Création initiale (formes exactes acceptées, tout le reste renvoyé à argparse)
+
+import pytest
+
+from utils.verbosity_config_tool import _parse_args_fast
+
+
+def test_no_arguments_defaults_to_interactive():
+    args = _parse_args_fast([])
+    assert (args.set, args.show, args.test, args.config_dir) == (None, False, False, None)
+
+
+@pytest.mark.parametrize("argv, attr, expected", [
+    (['--show'], 'show', True),
+    (['--test'], 'test', True),
+    (['--set', 'Debug'], 'set', 'Debug'),
+    (['--config-dir', '/tmp/config'], 'config_dir', '/tmp/config'),
+])
+def test_exact_forms_are_parsed(argv, attr, expected):
+    assert getattr(_parse_args_fast(argv), attr) == expected
+
+
+def test_value_and_flag_options_combine():
+    args = _parse_args_fast(['--config-dir', 'cfg', '--set', 'Faible'])
+    assert (args.config_dir, args.set, args.show) == ('cfg', 'Faible', False)
+
+
+@pytest.mark.parametrize("argv", [
+    ['-h'],
+    ['--help'],
+    ['--se', 'Debug'],             # Abréviation
+    ['--set=Debug'],               # Forme --opt=val
+    ['--set'],                     # Valeur manquante
+    ['--set', ''],                 # Valeur vide
+    ['--set', '--show'],           # Option prise pour une valeur
+    ['--show', '--show'],          # Répétition
+    ['--set', 'Debug', '--set', 'Faible'],
+    ['Debug'],                     # Argument positionnel
+    ['--unknown'],
+])
+def test_other_forms_fall_back_to_argparse(argv):
+    assert _parse_args_fast(argv) is None
@@ -2,8 +2,8 @@
 # -*- coding: utf-8 -*-
 """
 robot_tracker/ui/camera_display_widget.py
-Widget d'affichage caméra avec vues RGB et profondeur configurables - Version 1.1
-Modification: Suppression des valeurs statiques, configuration entièrement via JSON
+Widget d'affichage caméra avec vues RGB et profondeur configurables - Version 1.2
+Modification: Affichage direct des frames BGR (Format_BGR888, suppression de rgbSwapped)
 """
 
 import cv2
@@ -152,9 +152,10 @@ class SingleCameraView(QLabel):
         """Met à jour l'affichage Qt"""
         try:
             height, width, channel = frame.shape
-            bytes_per_line = 3 * width
+            bytes_per_line = frame.strides[0]
             
-            q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888).rgbSwapped()
+            # Frame BGR affichée telle quelle (pas de copie rgbSwapped)
+            q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format.Format_BGR888)
             pixmap = QPixmap.fromImage(q_image)
             
             self.setPixmap(pixmap)
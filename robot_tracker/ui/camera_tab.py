@@ -1,6 +1,6 @@
 # ui/camera_tab.py
-# Version 4.9 - Correction détection RealSense pour vue profondeur
-# Modification: Fix logique de détection du type RealSense dans _update_controls_state()
+# Version 4.10 - Affichage direct des frames BGR
+# Modification: QImage Format_BGR888 sans rgbSwapped dans update_frame
 
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
@@ -57,8 +57,9 @@ except ImportError:
             
             try:
                 height, width, channel = color_frame.shape
-                bytes_per_line = 3 * width
-                q_image = QImage(color_frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888).rgbSwapped()
+                bytes_per_line = color_frame.strides[0]
+                # Frame BGR affichée telle quelle (pas de copie rgbSwapped)
+                q_image = QImage(color_frame.data, width, height, bytes_per_line, QImage.Format.Format_BGR888)
                 pixmap = QPixmap.fromImage(q_image)
                 self.setPixmap(pixmap)
             except Exception as e:
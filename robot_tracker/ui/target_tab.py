@@ -1,11 +1,19 @@
 # ui/target_tab.py
-# Version 2.2 - Correction appel méthode detect_all_targets
-# Modification: Utilisation de detect_all_targets au lieu de detect
+# Version 2.76 - Tampon d'affichage unique
+# Modification: double buffer d'affichage supprimé, QPixmap.fromImage copie déjà les pixels
 
 import cv2
 import numpy as np
+import os
 import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import deque
+from itertools import compress
+from enum import IntEnum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 import logging
 
@@ -15,7 +23,7 @@ from PyQt6.QtWidgets import (
     QLineEdit, QTextEdit, QProgressBar, QFileDialog, QMessageBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QSlider, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize, QObject, QRunnable, QThreadPool, QMutex, QMutexLocker
 from PyQt6.QtGui import QPixmap, QImage, QFont, QIcon, QPainter, QPen, QColor
 
 logger = logging.getLogger(__name__)
@@ -24,6 +32,7 @@ try:
     from core.aruco_config_loader import ArUcoConfigLoader
     from core.target_detector import TargetDetector, TargetType
     from core.roi_manager import ROIManager, ROIType
+    from core.frame_pool import FramePool
     COMPONENTS_AVAILABLE = True
     logger.info("✅ Composants core importés avec succès")
 except ImportError as e:
@@ -54,6 +63,7 @@ except ImportError as e:
         def set_detection_enabled(self, target_type, enabled): pass
         def _init_aruco_detector(self): pass
         def update_detection_params(self, target_type, params): pass
+        def set_aruco_dictionary(self, dict_name): pass
     
     class TargetType:
         ARUCO = "aruco"
@@ -69,14 +79,531 @@ except ImportError as e:
         def finish_roi(self): self.is_creating = False
         def get_active_rois(self): return []
         def has_active_rois(self): return False
+        def clear_all_rois(self): self.rois.clear()
         def draw_rois_on_frame(self, frame): return frame
 
     class ROIType:
         RECTANGLE = "rectangle"
         POLYGON = "polygon"
+    
+    class FramePool:
+        def __init__(self, shape=None, size=4, dtype=np.uint8): pass
+        def acquire(self, shape, dtype=np.uint8): return np.empty(shape, dtype)
+        def release(self, buf): pass
+        def drain(self): pass
 
 logger = logging.getLogger(__name__)
 
+# Sentinelle pour distinguer une clé absente d'une valeur None en cache
+_CONFIG_MISSING = object()
+
+# Capacité initiale de l'historique de tracking (doublée à chaque dépassement)
+_HISTORY_INITIAL_ROWS = 4096
+
+# Bornes du sondage caméra en backoff exponentiel (ms)
+_CAMERA_POLL_MIN_MS = 100
+_CAMERA_POLL_MAX_MS = 2000
+_CAMERA_WATCHDOG_MS = 5000  # Vérification de secours quand une caméra est déjà active
+
+# Porte de mouvement : nombre max de frames servies depuis le cache avant revalidation
+_MOTION_GATE_MAX_REUSE = 10
+
+# Tranche d'attente du résultat de détection : l'arrêt du worker est vu en moins de 50 ms
+_DETECTION_WAIT_SLICE_S = 0.05
+
+# Attente max de la fin du thread d'acquisition (une lecture caméra en cours peut bloquer)
+_PRODUCER_STOP_TIMEOUT_MS = 500
+
+# QThreads encore actifs après leur arrêt : détachés de l'onglet, référencés ici jusqu'à finished
+_LINGERING_THREADS = set()
+
+
+def _linger_until_finished(thread: QThread):
+    """Sort un QThread encore actif de la hiérarchie de son parent, détruit sur son signal finished
+    
+    Un QThread détruit avec son parent pendant qu'il tourne fait avorter le processus.
+    """
+    thread.setParent(None)
+    _LINGERING_THREADS.add(thread)
+    
+    def _release_thread():
+        if thread in _LINGERING_THREADS:
+            _LINGERING_THREADS.discard(thread)
+            thread.deleteLater()
+    
+    thread.finished.connect(_release_thread)
+    if thread.isFinished():
+        _release_thread()  # Terminé entre wait() et la connexion : finished déjà émis
+
+
+class StatIdx(IntEnum):
+    """Index des compteurs de détection dans le tableau NumPy des statistiques"""
+    ARUCO = 0
+    REFLECTIVE = 1
+    LED = 2
+    EMPTY = 3  # Frames traitées sans cible
+
+
+_TARGET_STAT_IDX = {
+    TargetType.ARUCO: StatIdx.ARUCO,
+    TargetType.REFLECTIVE: StatIdx.REFLECTIVE,
+    TargetType.LED: StatIdx.LED
+}
+
+# Bit par type de cible : types vus sur la dernière frame, convertis en texte à 1 Hz seulement
+_TARGET_TYPE_BITS = {target_type: 1 << idx for target_type, idx in _TARGET_STAT_IDX.items()}
+
+# Rafraîchissement du panneau de statistiques (ms), indépendant de la cadence caméra
+_STATS_REFRESH_MS = 1000
+
+# Méthodes requises par composant de détection : attribut → (classe affichée, méthodes)
+_REQUIRED_COMPONENT_METHODS = MappingProxyType({
+    'aruco_loader': ('ArUcoConfigLoader', frozenset({
+        'scan_aruco_folder', 'get_latest_aruco_folder',
+        'get_detector_params', 'validate_markers'
+    })),
+    'target_detector': ('TargetDetector', frozenset({
+        'detect_all_targets', 'set_detection_enabled',
+        'set_roi', '_init_aruco_detector'
+    })),
+    'roi_manager': ('ROIManager', frozenset({
+        'start_roi_creation', 'get_active_rois',
+        'has_active_rois', 'draw_rois_on_frame'
+    }))
+})
+
+# Numba (requirements.txt) optionnel : noyau compilé pour la géométrie des overlays
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _axis_endpoints_kernel(centers, rotations, sizes):
+        """Extrémités (N, 3, 2) int32 des axes X, Y, Z (mêmes troncatures que le dessin d'origine)"""
+        n = centers.shape[0]
+        out = np.empty((n, 3, 2), dtype=np.int32)
+        for i in range(n):
+            cx, cy = centers[i, 0], centers[i, 1]
+            rad = np.deg2rad(rotations[i])
+            axis_len = int(sizes[i] * 0.4)
+            cos, sin = np.cos(rad), np.sin(rad)
+            z_offset = int(axis_len * 0.6) // 4
+            out[i, 0, 0] = int(cx + axis_len * cos)
+            out[i, 0, 1] = int(cy + axis_len * sin)
+            out[i, 1, 0] = int(cx - axis_len * sin)
+            out[i, 1, 1] = int(cy + axis_len * cos)
+            out[i, 2, 0] = int(cx - z_offset)
+            out[i, 2, 1] = int(cy - z_offset)
+        return out
+
+# Couleurs BGR des overlays, construites une seule fois (dessin OpenCV sur le ndarray)
+_ROI_COLOR = (0, 255, 255)            # Jaune
+_ARUCO_CONTOUR_COLOR = (0, 255, 0)    # Vert
+_AXIS_X_COLOR = (0, 0, 255)           # Rouge
+_AXIS_Y_COLOR = (0, 255, 0)           # Vert
+_AXIS_Z_COLOR = (255, 0, 0)           # Bleu
+_REFLECTIVE_COLOR = (0, 0, 255)       # Rouge
+_LED_DEFAULT_COLOR = (0, 255, 255)    # Jaune
+_LED_COLOR_MAP = MappingProxyType({  # Nom de couleur LED détectée → BGR
+    'red': (0, 0, 255),
+    'green': (0, 255, 0),
+    'blue': (255, 0, 0),
+    'yellow': (0, 255, 255),
+    'cyan': (255, 255, 0),
+    'magenta': (255, 0, 255)
+})
+_LABEL_BG_COLOR = (255, 255, 255)     # Blanc
+_TEXT_COLOR = (0, 0, 0)               # Noir
+
+# Paramètres de tracé invariants d'une cible à l'autre
+_LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_ARUCO_LABEL_SCALE = 0.7
+_ARUCO_LABEL_THICKNESS = 2
+_SMALL_LABEL_SCALE = 0.5
+_AXIS_TIP_LENGTH = 0.3
+
+
+class ArUcoScanSignals(QObject):
+    """Signaux du worker de scan ArUco (QRunnable ne dérive pas de QObject)"""
+    finished = pyqtSignal(dict)
+
+
+# Extensions d'images de marqueurs listées par le debug du scan
+_ARUCO_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+
+
+class ArUcoScanWorker(QRunnable):
+    """Scan d'un dossier ArUco exécuté dans le QThreadPool global"""
+    
+    def __init__(self, aruco_loader, folder_path: str):
+        super().__init__()
+        self.aruco_loader = aruco_loader
+        self.folder_path = folder_path
+        self.signals = ArUcoScanSignals()
+    
+    @staticmethod
+    def _debug_aruco_files(folder_path: str):
+        """Debug les fichiers dans le dossier ArUco (un seul parcours os.scandir)"""
+        try:
+            with os.scandir(folder_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+            
+            logger.info(f"🔍 CONTENU du dossier {Path(folder_path).name}:")
+            for entry in entries[:10]:  # Limiter à 10 fichiers
+                if entry.is_file():
+                    logger.info(f"  📄 Fichier: {entry.name} ({os.path.splitext(entry.name)[1]})")
+                else:
+                    logger.info(f"  📁 Dossier: {entry.name}")
+            
+            if len(entries) > 10:
+                logger.info(f"  ... et {len(entries) - 10} autres éléments")
+            
+            # Fichiers images spécifiquement
+            image_files = [entry.name for entry in entries
+                           if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _ARUCO_IMAGE_EXTENSIONS]
+            
+            logger.info(f"🖼️ FICHIERS IMAGES trouvés ({len(image_files)}):")
+            for name in image_files[:10]:
+                logger.info(f"  🖼️ {name}")
+                
+        except Exception as e:
+            logger.error(f"❌ Erreur debug fichiers: {e}")
+    
+    def run(self):
+        """Scan + validation + détection du dictionnaire, hors thread GUI"""
+        self._debug_aruco_files(self.folder_path)
+        
+        result = {
+            'folder_path': self.folder_path,
+            'markers': {},
+            'valid_count': 0,
+            'issues': [],
+            'dict_type': "4X4_50"
+        }
+        
+        # Scan avec gestion d'erreur robuste
+        if hasattr(self.aruco_loader, 'scan_aruco_folder'):
+            try:
+                detected_markers = self.aruco_loader.scan_aruco_folder(self.folder_path)
+                if isinstance(detected_markers, dict):
+                    result['markers'] = detected_markers
+                else:
+                    logger.warning(f"⚠️ Format retour scan invalide: {type(detected_markers)}")
+            except Exception as scan_error:
+                logger.error(f"❌ Erreur scan ArUco: {scan_error}")
+        
+        # Validation avec gestion d'erreur
+        if hasattr(self.aruco_loader, 'validate_markers'):
+            try:
+                result['valid_count'], result['issues'] = self.aruco_loader.validate_markers()
+            except Exception as validation_error:
+                logger.warning(f"⚠️ Erreur validation: {validation_error}")
+        
+        # Détection automatique du dictionnaire avec fallback
+        if result['markers'] and hasattr(self.aruco_loader, '_detect_common_dictionary'):
+            try:
+                result['dict_type'] = self.aruco_loader._detect_common_dictionary()
+            except Exception:
+                logger.warning("⚠️ Détection dictionnaire échouée, utilisation 4X4_50")
+        
+        self.signals.finished.emit(result)
+
+
+class FrameProducer(QThread):
+    """Acquisition caméra dans un QThread dédié, cadencée indépendamment de la boucle Qt
+    
+    Le thread dépose la dernière frame dans un emplacement protégé par QMutex et ne
+    signale frame_ready que si la précédente a été consommée : le thread GUI ne voit
+    jamais de file d'événements accumulés, seulement la frame la plus récente.
+    """
+    
+    frame_ready = pyqtSignal()   # Une nouvelle frame attend dans l'emplacement
+    camera_lost = pyqtSignal()   # La caméra ne répond plus
+    
+    def __init__(self, get_frame, is_open, camera_alias: str, target_interval_ms: int, parent=None):
+        super().__init__(parent)
+        self._get_frame = get_frame  # alias → (succès, frame, profondeur), résolu une fois par l'onglet
+        self._is_open = is_open      # alias → bool
+        self.camera_alias = camera_alias
+        self.target_interval_ms = target_interval_ms  # Affectation atomique (GIL)
+        self._running = False
+        self._wake = threading.Event()  # Porte de cadencement, levée par stop()
+        self._mutex = QMutex()
+        self._latest = None
+        self._pending = False
+    
+    def take_latest(self):
+        """Retire la dernière frame (thread GUI). Retourne (frame, profondeur) ou None"""
+        with QMutexLocker(self._mutex):
+            latest, self._latest = self._latest, None
+            self._pending = False
+        return latest
+    
+    def stop(self, timeout_ms: int = _PRODUCER_STOP_TIMEOUT_MS) -> bool:
+        """Arrête la boucle d'acquisition et attend la fin du thread (au plus timeout_ms)
+        
+        Returns:
+            True si le thread est terminé, False s'il est resté bloqué (lecture caméra)
+        """
+        self._running = False
+        self._wake.set()
+        if self.wait(timeout_ms):
+            return True
+        logger.warning("⚠️ Thread d'acquisition toujours actif après %d ms", timeout_ms)
+        return False
+    
+    def run(self):
+        """Boucle d'acquisition : lecture, dépôt, attente du reste de l'intervalle"""
+        self._running = True
+        self._wake.clear()
+        
+        while self._running:
+            start = time.perf_counter()
+            try:
+                success, frame, depth_frame = self._get_frame(self.camera_alias)
+                
+                if success and frame is not None:
+                    with QMutexLocker(self._mutex):
+                        self._latest = (frame, depth_frame)
+                        notify = not self._pending
+                        self._pending = True
+                    if notify:
+                        self.frame_ready.emit()
+                elif not self._is_open(self.camera_alias):
+                    logger.warning(f"⚠️ Caméra {self.camera_alias} non disponible")
+                    self.camera_lost.emit()
+                    break
+            except Exception as e:
+                logger.error("❌ Erreur acquisition frame: %s", e)
+            
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._wake.wait(max(0.0, self.target_interval_ms - elapsed_ms) / 1000)
+        
+        self._running = False
+
+
+class DetectionWorker(QThread):
+    """Détection des cibles dans un QThread dédié (le thread GUI ne fait que le rendu)
+    
+    Contrat zéro-copie : submit() reçoit (jeton, vue ndarray en lecture seule) sur un
+    buffer du FramePool. Le worker ne modifie jamais la vue et émet frame_released(jeton)
+    une fois la détection terminée ; seul le thread GUI rend alors le buffer au pool.
+    
+    Canal « dernière frame gagnante » : file bornée à 2 entrées, la plus ancienne est
+    abandonnée quand une nouvelle frame arrive sur une file pleine.
+    """
+    
+    targets_ready = pyqtSignal(list, tuple)  # (détections, taille de la frame source)
+    frame_released = pyqtSignal(int)         # Jeton du buffer dont le worker n'a plus besoin
+    
+    def __init__(self, target_detector, motion_thresh: float = 1.5, deadline_s: float = 1.0, parent=None):
+        super().__init__(parent)
+        self.target_detector = target_detector
+        self._queue = queue.Queue(maxsize=2)
+        self._small_buf = None  # Frame réduite, propre au thread worker
+        
+        # Échéance par détection : un seul exécuteur pour toute la vie du worker
+        self.deadline_s = deadline_s
+        self._exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='target-detection',
+                                        initializer=self._pin_thread)
+        self._late_future = None  # Détection hors délai encore en cours (garde sa frame)
+        
+        # Porte de mouvement : réutilise les détections tant que la scène ne bouge pas
+        self.motion_thresh = motion_thresh
+        self._last_gray_small = None  # Vignette 64×48 de la dernière détection complète
+        self._last_sharpness = 0.0    # Variance du Laplacien de cette vignette
+        self._last_results = []
+        self._frames_since_full = 0
+    
+    def submit(self, pool_token: int, frame, scale: float) -> Tuple[Optional[int], int]:
+        """Dépose une frame (thread GUI). Retourne (jeton abandonné ou None, remplissage de la file)"""
+        dropped_token = None
+        try:
+            self._queue.put_nowait((pool_token, frame, scale))
+        except queue.Full:
+            try:
+                dropped_token = self._queue.get_nowait()[0]
+            except queue.Empty:
+                pass  # Le worker vient de vider la file
+            self._queue.put_nowait((pool_token, frame, scale))
+        return dropped_token, self._queue.qsize()
+    
+    def stop(self):
+        """Demande l'arrêt de la boucle (sentinelle prioritaire sur les frames en attente)
+        
+        Les frames retirées de la file ne seront jamais traitées : leurs jetons sont rendus
+        par frame_released comme pour une frame détectée.
+        """
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.frame_released.emit(item[0])
+        self._queue.put(None)
+    
+    def _pin_thread(self):
+        """Fixe le thread appelant sur le cœur autorisé de plus haut numéro et initialise OpenCL pour ce thread
+        
+        Seule l'affinité de ce thread change : le nombre de threads OpenCV (réglage global au
+        processus) n'est pas modifié ici.
+        """
+        try:
+            # Linux : pid 0 désigne le thread appelant. Avec au moins deux cœurs autorisés,
+            # le plus haut numéro n'est jamais le cœur 0 ; avec un seul cœur, pas d'épinglage.
+            if hasattr(os, 'sched_setaffinity'):
+                cores = os.sched_getaffinity(0)
+                if len(cores) > 1:
+                    core_id = max(cores)
+                    os.sched_setaffinity(0, {core_id})
+                    logger.debug("📌 Worker de détection fixé sur le cœur %s", core_id)
+            
+            # Contexte OpenCL créé sur ce thread une fois pour toutes
+            if getattr(self.target_detector, 'use_opencl', False):
+                cv2.ocl.Device_getDefault()
+                
+        except Exception as e:
+            logger.debug("⚠️ Affinité worker non appliquée: %s", e)
+    
+    def run(self):
+        """Boucle du worker : attente de la prochaine frame jusqu'à demande d'interruption
+        
+        Ce thread n'est pas épinglé : seul le thread de l'exécuteur (detect_all_targets) l'est,
+        via l'initializer, pour que les deux ne se disputent pas le même cœur.
+        """
+        while not self.isInterruptionRequested():
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            pool_token, frame, scale = item
+            late_future = self._detect(frame, scale)
+            if late_future is None:
+                self.frame_released.emit(pool_token)
+            else:
+                # Le buffer reste prêté jusqu'à la fin effective de la détection
+                late_future.add_done_callback(lambda _f, token=pool_token: self.frame_released.emit(token))
+        
+        self._exec.shutdown(wait=False, cancel_futures=True)
+    
+    def _motion_gate(self, frame):
+        """Retourne (scène inchangée, vignette) — vignette grise 64×48, coût de l'ordre de la µs"""
+        small = cv2.resize(frame, (64, 48), interpolation=cv2.INTER_AREA)
+        cur = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+        
+        if (self._last_gray_small is None or not self._last_results
+                or self._frames_since_full >= _MOTION_GATE_MAX_REUSE):
+            return False, cur
+        
+        # Flou soudain (bougé, mise au point) : la netteté chute, on revalide
+        sharpness = cv2.Laplacian(cur, cv2.CV_64F).var()
+        if sharpness < 0.5 * self._last_sharpness:
+            return False, cur
+        
+        diff = cv2.absdiff(cur, self._last_gray_small).mean()
+        return diff < self.motion_thresh, cur
+    
+    def _detect(self, frame, scale: float):
+        """Sous-échantillonnage + détection d'une frame. Retourne la future hors délai qui lit encore la frame, sinon None"""
+        detected_results = []
+        late_future = None
+        
+        # Détection précédente toujours en cours : frame ignorée, le buffer réduit est occupé
+        if self._late_future is not None:
+            if not self._late_future.done():
+                self.targets_ready.emit([], tuple(frame.shape[:2]))
+                return None
+            self._late_future = None
+        
+        try:
+            unchanged, gray_small = self._motion_gate(frame)
+            if unchanged:
+                self._frames_since_full += 1
+                self.targets_ready.emit(list(self._last_results), tuple(frame.shape[:2]))
+                return None
+            
+            # Sous-échantillonnage éventuel avant détection (coût O(W·H))
+            if scale < 1.0:
+                # Réduction dans un buffer réutilisé (aucune détection ne le référence ensuite)
+                height, width = frame.shape[:2]
+                small_shape = (max(1, round(height * scale)), max(1, round(width * scale))) + frame.shape[2:]
+                if self._small_buf is None or self._small_buf.shape != small_shape:
+                    self._small_buf = np.empty(small_shape, dtype=frame.dtype)
+                detection_frame = cv2.resize(frame, (small_shape[1], small_shape[0]),
+                                             dst=self._small_buf, interpolation=cv2.INTER_AREA)
+            else:
+                detection_frame = frame
+            
+            future = self._exec.submit(self.target_detector.detect_all_targets, detection_frame)
+            try:
+                detected_results = self._wait_detection(future)
+            except FutureTimeoutError:
+                if not future.cancel():
+                    late_future = self._late_future = future
+                if not self.isInterruptionRequested():
+                    logger.warning("⚠️ Détection hors délai (> %.1fs), frame ignorée", self.deadline_s)
+                detected_results = []
+                self._last_results = []
+                self.targets_ready.emit(detected_results, tuple(frame.shape[:2]))
+                return late_future
+            
+            # Validation du résultat
+            if not isinstance(detected_results, list):
+                logger.warning("⚠️ Format retour détection invalide: %s", type(detected_results))
+                detected_results = []
+            elif scale < 1.0:
+                self._rescale_detections(detected_results, 1.0 / scale)
+            
+            self._last_gray_small = gray_small
+            self._last_sharpness = cv2.Laplacian(gray_small, cv2.CV_64F).var()
+            self._last_results = detected_results
+            self._frames_since_full = 0
+                
+        except Exception as detection_error:
+            logger.error("❌ Erreur détection: %s", detection_error)
+            detected_results = []
+            self._last_results = []
+        
+        self.targets_ready.emit(detected_results, tuple(frame.shape[:2]))
+        return None
+    
+    def _wait_detection(self, future):
+        """Attend le résultat par tranches courtes : FutureTimeoutError à l'échéance ou sur demande d'arrêt"""
+        deadline = time.monotonic() + self.deadline_s
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                return future.result(timeout=max(0.0, min(_DETECTION_WAIT_SLICE_S, remaining)))
+            except FutureTimeoutError:
+                if remaining <= _DETECTION_WAIT_SLICE_S or self.isInterruptionRequested():
+                    raise
+    
+    @staticmethod
+    def _rescale_detections(detections, factor: float):
+        """Ramène les coordonnées détectées sur une frame réduite à la résolution native"""
+        for detection in detections:
+            detection.center = (int(detection.center[0] * factor), int(detection.center[1] * factor))
+            detection.corners = [(int(x * factor), int(y * factor)) for x, y in detection.corners]
+            detection.size = detection.size * factor
+
+
+# Paramètres externes acceptés : clé → (setter, type attendu, bornes incluses ou None)
+_PARAM_SCHEMA = {
+    'fps_target': (lambda tab, v: tab.fps_spin.setValue(v), int, (1, 120)),
+    'confidence_threshold': (lambda tab, v: tab.confidence_spin.setValue(v), int, (0, 100)),
+    'detection_types': (lambda tab, v: tab._apply_detection_types(v), dict, None),
+    'max_history': (lambda tab, v: tab._set_max_history(v), int, (1, 10_000_000)),
+    'max_side': (lambda tab, v: setattr(tab, '_max_detection_side', v), int, (0, 16384)),
+    'tracking_stride': (lambda tab, v: tab._apply_tracking_stride(v), int, (1, 1000)),
+}
+
+
 class TargetTab(QWidget):
     """Onglet Cible - Focus détection/suivi avec détection automatique caméra"""
     
@@ -85,6 +612,7 @@ class TargetTab(QWidget):
     tracking_started = pyqtSignal()          # Signal tracking démarré
     tracking_stopped = pyqtSignal()          # Signal tracking arrêté
     status_changed = pyqtSignal(dict)        # Signal changement d'état
+    parametersChanged = pyqtSignal(dict)     # Paramètres de détection appliqués en bloc
     
     def __init__(self, config_manager, camera_manager, parent=None):
         super().__init__(parent)
@@ -92,44 +620,112 @@ class TargetTab(QWidget):
         # Configuration et managers
         self.config = config_manager
         self.camera_manager = camera_manager  # Référence au manager centralisé
+        self._cfg_cache = {}  # Cache des lectures de configuration (section, clé) → valeur
+        self._status_cache = None  # Dernier get_tracking_status(), reconstruit si _status_dirty
+        self._status_dirty = True
         
         # État de l'onglet
         self.is_tracking = False
         self.current_frame = None
         self.current_depth_frame = None
+        self._display_buf = None  # Buffer d'affichage avec overlays, référencé par _display_image
+        self._display_image = None
+        self._depth_buf = None  # Profondeur normalisée uint8 référencée par le QImage
+        self._preview_buf = None  # Aperçu zoomé (cv2.resize), référencé par _preview_image
+        self._preview_image = None
+        self._frame_seq = 0  # Numéro de la frame courante (les buffers du pool sont recyclés)
+        self._last_displayed_seq = -1  # Frame du dernier rendu (évite les repaints identiques)
+        self._frame_pool = FramePool(size=4)
+        self._inflight_frames = {}  # Jeton → buffer prêté au worker de détection
+        self._current_frame_pooled = False  # current_frame provient du FramePool (sinon vue caméra)
+        self._last_overlay_state = None
+        self._text_size_cache = {}  # (texte, police, échelle, épaisseur) → (largeur, hauteur)
+        self._aruco_cfg_dialog = None  # Dialogue de configuration avancée, construit au premier affichage
+        self._aruco_cfg_spins = {}
+        self._draw_dispatch = {
+            TargetType.ARUCO: self._draw_aruco_targets,
+            TargetType.REFLECTIVE: self._draw_reflective_targets,
+            TargetType.LED: self._draw_led_targets
+        }
         self.camera_ready = False
         self.selected_camera_alias = None
+        self._last_status_color = 'red'  # Couleur courante du label statut (style initial)
         
         # Données de tracking
-        self.detected_targets = []
-        self.tracking_history = []
+        self.detected_targets = deque(maxlen=512)
+        self._n_targets = 0  # Taille de detected_targets, tenue à jour par les seuls sites de mutation
+        self.max_history = int(self._safe_get_config('tracking', 'target_tab.max_history', 2000))
+        self._reset_tracking_history()
         self.detection_stats = {
             'total_detections': 0,
             'fps': 0.0,
-            'last_detection_time': 0.0
+            'last_detection_time': 0.0,
+            'frames_dropped': 0,
+            'queue_high_water': 0,
+            'capture_fps': 0.0
         }
         
+        self._stats_arr = np.zeros(len(StatIdx), dtype=np.int64)
+        self._proc_time_ema = 0.0  # Durée moyenne (ms) du traitement GUI d'une frame
+        self._frames_since_throttle = 0
+        
+        # FPS lissé (EWMA sur perf_counter) ; panneau stats réécrit par _refresh_stats_text (QTimer 1 Hz)
+        self._last_detection_time = 0.0
+        self._ewma_fps = 0.0
+        self._last_detection_count = 0
+        self._last_type_bits = 0
+        self._last_stats_values = None
+        
+        # Échelle de détection adaptative (AIMD selon le FPS mesuré)
+        self._detection_scale = 1.0
+        self._fast_ticks = 0
+        
+        # Plus grand côté transmis au détecteur (0 = résolution native)
+        self._max_detection_side = int(self._safe_get_config('tracking', 'target_detection.max_detection_side', 960))
+        
+        # Scan ArUco asynchrone (QThreadPool global)
+        self._aruco_scan_worker = None
+        
         # ORDRE CORRECT :
         # 1. D'ABORD : Composants de détection
         self._init_detection_components()
-        
-        # 2. ENSUITE : Interface utilisateur
+        self._resolve_camera_accessors()
+        
+        # Thread de détection (file bornée « dernière frame gagnante »)
+        motion_thresh = float(self._safe_get_config('tracking', 'target_detection.motion_gate_thresh', 1.5))
+        deadline_s = float(self._safe_get_config('tracking', 'target_detection.deadline_s', 1.0))
+        self._detection_worker = DetectionWorker(self.target_detector, motion_thresh, deadline_s, self)
+        self._detection_worker.targets_ready.connect(self._on_targets_ready)
+        self._detection_worker.frame_released.connect(self._on_frame_released)
+        self._detection_worker.start(QThread.Priority.HighPriority)
+        
+        # 2. ENSUITE : Interface utilisateur (panneau de contrôle différé, voir showEvent)
+        # 3. ENFIN : Auto-chargement ArUco, fait à la construction du panneau
+        self._ui_built = False
+        self._ui_labels = self._safe_get_config('ui', 'ui_labels', {}) or {}  # Libellés lus en une fois
         self._setup_ui()
-        self._connect_internal_signals()
         
-        # 3. ENFIN : Auto-chargement ArUco (après que tout soit créé)
-        self._auto_load_latest_aruco_folder()
+        # Thread d'acquisition, créé au démarrage du streaming
+        self._frame_producer = None
         
-        # Timer pour le traitement des frames
-        self.processing_timer = QTimer()
-        self.processing_timer.timeout.connect(self._process_current_frame)
+        # Rendu cadencé par un timer, découplé de l'acquisition et de la détection
+        self._display_dirty = False
+        self._display_timer = QTimer(self)
+        self._display_timer.setInterval(int(self._safe_get_config('ui', 'target_tab.display_interval_ms', 33)))
+        self._display_timer.timeout.connect(self._on_display_tick)
+        
+        # Panneau de statistiques rafraîchi à 1 Hz pendant le tracking
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self._refresh_stats_text)
         
         # Timer pour vérifier l'état des caméras
+        # Sondage en backoff exponentiel tant qu'aucune caméra n'est trouvée, arrêté ensuite
         self.camera_check_timer = QTimer()
+        self.camera_check_timer.setSingleShot(True)
         self.camera_check_timer.timeout.connect(self._check_camera_status)
-        self.camera_check_timer.start(1000)  # Vérification chaque seconde
+        self._poll_delay_ms = _CAMERA_POLL_MIN_MS
         
-        version = self._safe_get_config('ui', 'target_tab.version', '2.2')
+        version = self._safe_get_config('ui', 'target_tab.version', '2.71')
         logger.info(f"🎯 TargetTab v{version} initialisé (détection auto caméra)")
         
         # Vérification initiale de l'état des caméras
@@ -178,7 +774,40 @@ class TargetTab(QWidget):
             self.aruco_loader = ArUcoConfigLoader(self.config)
             self.target_detector = TargetDetector(self.config)
             self.roi_manager = ROIManager(self.config)
-
+    
+    def _resolve_camera_accessors(self):
+        """Résout une fois les accès au camera_manager (plus de sondes hasattr à chaque appel)"""
+        cm = self.camera_manager
+        
+        # Liste des caméras actives
+        if hasattr(cm, 'active_cameras'):
+            # Propriété relue à chaque appel : dict ou liste selon le manager
+            def get_active_cameras():
+                active = cm.active_cameras
+                return list(active.keys()) if isinstance(active, dict) else list(active or [])
+            self._get_active_cameras = get_active_cameras
+        elif hasattr(cm, 'get_active_cameras'):
+            self._get_active_cameras = cm.get_active_cameras
+        else:
+            self._get_active_cameras = lambda: []
+        
+        # Lecture d'une frame
+        if hasattr(cm, 'get_camera_frame'):
+            self._get_frame = cm.get_camera_frame
+        elif hasattr(cm, 'get_latest_frame'):
+            # Fallback si méthode différente
+            def get_frame(alias):
+                result = cm.get_latest_frame()
+                if isinstance(result, tuple) and len(result) >= 2:
+                    return result[0], result[1], result[2] if len(result) > 2 else None
+                return False, None, None
+            self._get_frame = get_frame
+        else:
+            logger.warning("⚠️ Aucune méthode de récupération frame disponible")
+            self._get_frame = lambda alias: (False, None, None)
+        
+        # État d'ouverture (caméra supposée ouverte si le manager ne sait pas le dire)
+        self._is_open = cm.is_camera_open if hasattr(cm, 'is_camera_open') else (lambda alias: True)
     
     def _auto_load_latest_aruco_folder(self):
         """Charge automatiquement le dernier dossier ArUco disponible"""
@@ -193,27 +822,89 @@ class TargetTab(QWidget):
             logger.warning(f"⚠️ Erreur auto-chargement ArUco: {e}")
     
     def _safe_get_config(self, section: str, key: str, default=None):
-        """Accès sécurisé à la configuration"""
-        try:
-            return self.config.get(section, key, default) if hasattr(self.config, 'get') else default
-        except Exception:
-            return default
+        """Accès sécurisé à la configuration (mémoïsé par section/clé)"""
+        cache_key = (section, key)
+        value = self._cfg_cache.get(cache_key, _CONFIG_MISSING)
+        if value is _CONFIG_MISSING and cache_key not in self._cfg_cache:
+            try:
+                if hasattr(self.config, 'get'):
+                    value = self.config.get(section, key, _CONFIG_MISSING)
+            except Exception:
+                value = _CONFIG_MISSING
+            self._cfg_cache[cache_key] = value
+        return default if value is _CONFIG_MISSING else value
+    
+    def invalidate_config_cache(self):
+        """Vide le cache de configuration (à appeler après rechargement de la config)"""
+        self._cfg_cache.clear()
+        self._ui_labels = self._safe_get_config('ui', 'ui_labels', {}) or {}
+    
+    def _label(self, key: str, default: str) -> str:
+        """Libellé UI lu dans ui.ui_labels chargé une seule fois (clé pointée, ex. 'buttons.start_tracking')"""
+        node = self._ui_labels
+        for part in key.split('.'):
+            if not isinstance(node, dict):
+                return default
+            node = node.get(part, _CONFIG_MISSING)
+            if node is _CONFIG_MISSING:
+                return default
+        return node if isinstance(node, str) else default
     
     def _setup_ui(self):
         """Configure l'interface utilisateur simplifiée"""
         main_layout = QHBoxLayout(self)
         
-        # Panneau de contrôle (gauche) - Focus détection
-        control_panel = self._create_control_panel()
+        # Panneau de contrôle (gauche) - construit au premier affichage de l'onglet
+        self._control_placeholder = QLabel("⏳ Chargement...")
+        self._control_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         control_width = self._safe_get_config('ui', 'target_tab.layout.control_panel_width', 320)
-        control_panel.setMaximumWidth(control_width)
+        self._control_placeholder.setMaximumWidth(control_width)
         
         # Zone d'affichage (droite) - Flux caméra + overlays
         display_area = self._create_display_area()
         
-        main_layout.addWidget(control_panel)
+        main_layout.addWidget(self._control_placeholder)
         main_layout.addWidget(display_area, 1)
     
+    def _ensure_control_panel(self):
+        """Construit le panneau de contrôle à la première demande (affichage ou usage externe)
+        
+        _ui_built n'est levé qu'une fois le panneau créé et placé : après un échec, le
+        placeholder reste en place et la demande suivante retente la construction.
+        """
+        if self._ui_built:
+            return
+        
+        try:
+            control_panel = self._create_control_panel()
+        except Exception as e:
+            logger.error(f"❌ Erreur construction panneau de contrôle: {e}")
+            return
+        
+        try:
+            control_panel.setMaximumWidth(self._control_placeholder.maximumWidth())
+            self.layout().replaceWidget(self._control_placeholder, control_panel)
+            self._control_placeholder.deleteLater()
+            self._control_placeholder = None
+            self._ui_built = True
+            
+            # Connexions et auto-chargement une seule fois, panneau en place
+            self._connect_internal_signals()
+            
+            # Auto-chargement ArUco (après que tout soit créé)
+            self._auto_load_latest_aruco_folder()
+            self._update_camera_status()
+            
+            logger.debug("🎨 Panneau de contrôle TargetTab construit")
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur construction panneau de contrôle: {e}")
+    
+    def showEvent(self, event):
+        """Construit les widgets de contrôle au premier affichage"""
+        self._ensure_control_panel()
+        super().showEvent(event)
+    
     def _create_control_panel(self):
         """Crée le panneau de contrôle focalisé sur la détection"""
         panel = QWidget()
@@ -250,7 +941,7 @@ class TargetTab(QWidget):
     
     def _create_camera_status_group(self):
         """État de la caméra - Lecture seule, géré par onglet caméra"""
-        group = QGroupBox(self._safe_get_config('ui', 'ui_labels.groups.camera_status', '📷 État Caméra'))
+        group = QGroupBox(self._label('groups.camera_status', '📷 État Caméra'))
         layout = QVBoxLayout(group)
         
         # Status display
@@ -272,14 +963,14 @@ class TargetTab(QWidget):
     
     def _create_aruco_config_group(self):
         """Configuration ArUco avec bouton debug"""
-        group = QGroupBox(self._safe_get_config('ui', 'ui_labels.groups.aruco_config', '🎯 Configuration ArUco'))
+        group = QGroupBox(self._label('groups.aruco_config', '🎯 Configuration ArUco'))
         layout = QVBoxLayout(group)
         
         # Sélection dossier
         folder_layout = QHBoxLayout()
-        self.select_aruco_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.select_aruco_folder', '📁 Sélectionner Dossier'))
+        self.select_aruco_btn = QPushButton(self._label('buttons.select_aruco_folder', '📁 Sélectionner Dossier'))
         self.select_aruco_btn.clicked.connect(self._select_aruco_folder)
-        self.rescan_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.rescan_folder', '🔄'))
+        self.rescan_btn = QPushButton(self._label('buttons.rescan_folder', '🔄'))
         self.rescan_btn.clicked.connect(self._rescan_aruco_folder)
         self.rescan_btn.setFixedWidth(40)
         self.rescan_btn.setEnabled(False)
@@ -316,7 +1007,7 @@ class TargetTab(QWidget):
     
     def _create_detection_types_group(self):
         """Types de détection activables"""
-        group = QGroupBox(self._safe_get_config('ui', 'ui_labels.groups.detection_types', '🔍 Types de Détection'))
+        group = QGroupBox(self._label('groups.detection_types', '🔍 Types de Détection'))
         layout = QVBoxLayout(group)
         
         # ArUco
@@ -341,19 +1032,19 @@ class TargetTab(QWidget):
     
     def _create_roi_tools_group(self):
         """Outils de ROI"""
-        group = QGroupBox(self._safe_get_config('ui', 'ui_labels.groups.roi_tools', '📐 Outils ROI'))
+        group = QGroupBox(self._label('groups.roi_tools', '📐 Outils ROI'))
         layout = QVBoxLayout(group)
         
         # Boutons outils
         tools_layout = QHBoxLayout()
         
-        self.roi_rect_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.roi_rectangle', '⬜ Rectangle'))
+        self.roi_rect_btn = QPushButton(self._label('buttons.roi_rectangle', '⬜ Rectangle'))
         self.roi_rect_btn.clicked.connect(lambda: self._start_roi_creation('rectangle'))
         
-        self.roi_poly_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.roi_polygon', '⬟ Polygone'))
+        self.roi_poly_btn = QPushButton(self._label('buttons.roi_polygon', '⬟ Polygone'))
         self.roi_poly_btn.clicked.connect(lambda: self._start_roi_creation('polygon'))
         
-        self.clear_roi_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.clear_roi', '🗑️ Effacer'))
+        self.clear_roi_btn = QPushButton(self._label('buttons.clear_roi', '🗑️ Effacer'))
         self.clear_roi_btn.clicked.connect(self._clear_all_rois)
         
         tools_layout.addWidget(self.roi_rect_btn)
@@ -369,16 +1060,16 @@ class TargetTab(QWidget):
     
     def _create_tracking_controls_group(self):
         """Contrôles de tracking"""
-        group = QGroupBox(self._safe_get_config('ui', 'ui_labels.groups.tracking_controls', '🎬 Contrôles Tracking'))
+        group = QGroupBox(self._label('groups.tracking_controls', '🎬 Contrôles Tracking'))
         layout = QVBoxLayout(group)
         
         # Boutons contrôle
         buttons_layout = QHBoxLayout()
         
-        self.start_tracking_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.start_tracking', '▶️ Démarrer'))
+        self.start_tracking_btn = QPushButton(self._label('buttons.start_tracking', '▶️ Démarrer'))
         self.start_tracking_btn.clicked.connect(self._start_tracking)
         
-        self.stop_tracking_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.stop_tracking', '⏹️ Arrêter'))
+        self.stop_tracking_btn = QPushButton(self._label('buttons.stop_tracking', '⏹️ Arrêter'))
         self.stop_tracking_btn.clicked.connect(self._stop_tracking)
         self.stop_tracking_btn.setEnabled(False)
         
@@ -411,7 +1102,7 @@ class TargetTab(QWidget):
     
     def _create_statistics_group(self):
         """Statistiques de détection"""
-        group = QGroupBox(self._safe_get_config('ui', 'ui_labels.groups.statistics', '📊 Statistiques'))
+        group = QGroupBox(self._label('groups.statistics', '📊 Statistiques'))
         layout = QVBoxLayout(group)
         
         self.stats_text = QTextEdit()
@@ -450,16 +1141,32 @@ class TargetTab(QWidget):
         self.zoom_slider.setRange(25, 200)
         self.zoom_slider.setValue(100)
         self.zoom_slider.valueChanged.connect(self._on_zoom_changed)
+        self.zoom_slider.sliderReleased.connect(self._do_zoom_update)
+        
+        # Debounce du zoom : un seul rendu par ~frame pendant le glissement
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._do_zoom_update)
         controls_layout.addWidget(self.zoom_slider)
         
         self.zoom_label = QLabel("100%")
         self.zoom_label.setFixedWidth(50)
         controls_layout.addWidget(self.zoom_label)
         
+        # Vue profondeur (niveaux de gris, palette optionnelle)
+        self.depth_view_check = QCheckBox("Profondeur")
+        self.depth_view_check.toggled.connect(self._mark_display_dirty)
+        controls_layout.addWidget(self.depth_view_check)
+        
+        self.depth_colormap_check = QCheckBox("Palette")
+        self.depth_colormap_check.toggled.connect(self._mark_display_dirty)
+        controls_layout.addWidget(self.depth_colormap_check)
+        
         controls_layout.addStretch()
         
         # Export données
-        self.export_btn = QPushButton(self._safe_get_config('ui', 'ui_labels.buttons.export_data', '💾 Exporter Données'))
+        self.export_btn = QPushButton(self._label('buttons.export_data', '💾 Exporter Données'))
         self.export_btn.clicked.connect(self._export_tracking_data)
         self.export_btn.setEnabled(False)
         controls_layout.addWidget(self.export_btn)
@@ -470,8 +1177,8 @@ class TargetTab(QWidget):
     
     def _connect_internal_signals(self):
         """Connecte les signaux internes de l'onglet"""
-        # TODO: Connections internes si nécessaire
-        pass
+        self.parametersChanged.connect(self._on_parameters_changed)
+        self.fps_spin.valueChanged.connect(self._on_fps_changed)
     
     # === SLOTS POUR SIGNAUX CAMERA_TAB ===
     
@@ -480,11 +1187,15 @@ class TargetTab(QWidget):
         logger.info(f"📷 Signal caméra changée reçu: {camera_alias}")
         
         # Vérifier si la caméra est bien active
-        if not self.camera_manager.is_camera_open(camera_alias):
+        if not self._is_open(camera_alias):
             logger.warning(f"⚠️ Caméra {camera_alias} non disponible")
             self.camera_ready = False
             self.selected_camera_alias = None
             self._update_camera_status()
+            
+            # Reprise du sondage au rythme le plus rapide
+            self._poll_delay_ms = _CAMERA_POLL_MIN_MS
+            self._schedule_camera_check(False)
             return
         
         # Arrêt du tracking si actif
@@ -495,31 +1206,14 @@ class TargetTab(QWidget):
         self.selected_camera_alias = camera_alias
         self.camera_ready = True
         self._update_camera_status()
+        self._schedule_camera_check(True)
         
         logger.info(f"✅ Caméra {camera_alias} sélectionnée pour détection")
     
     def _check_camera_status(self):
         """Vérifie automatiquement l'état des caméras actives - Version corrigée"""
         try:
-            # FIX: Utilisation sécurisée de active_cameras
-            if hasattr(self.camera_manager, 'active_cameras'):
-                active_cameras = getattr(self.camera_manager, 'active_cameras', {})
-                # Conversion en liste si c'est un dict
-                if isinstance(active_cameras, dict):
-                    active_camera_list = list(active_cameras.keys())
-                elif isinstance(active_cameras, list):
-                    active_camera_list = active_cameras
-                else:
-                    active_camera_list = []
-            else:
-                # Fallback si pas d'attribut active_cameras
-                try:
-                    if hasattr(self.camera_manager, 'get_active_cameras'):
-                        active_camera_list = self.camera_manager.get_active_cameras()
-                    else:
-                        active_camera_list = []
-                except:
-                    active_camera_list = []
+            active_camera_list = self._get_active_cameras()
 
             if not active_camera_list:
                 # Aucune caméra active
@@ -539,33 +1233,63 @@ class TargetTab(QWidget):
                     self.camera_ready = True
             
             self._update_camera_status()
+            self._schedule_camera_check(bool(active_camera_list))
             
         except Exception as e:
-            logger.error(f"❌ Erreur vérification caméras: {e}")
+            logger.error("❌ Erreur vérification caméras: %s", e)
             self.camera_ready = False
             self.selected_camera_alias = None
             self._update_camera_status()
+            self._schedule_camera_check(False)
+    
+    def _schedule_camera_check(self, camera_found: bool):
+        """Planifie le prochain sondage caméra (backoff 100 ms → 2 s, chien de garde 5 s si caméra trouvée)"""
+        if camera_found:
+            # Caméra présente : la perte est signalée par camera_closed ou par l'échec de lecture,
+            # le sondage lent ne sert que de filet de sécurité
+            self._poll_delay_ms = _CAMERA_POLL_MIN_MS
+            self.camera_check_timer.start(_CAMERA_WATCHDOG_MS)
+            return
+        
+        self.camera_check_timer.start(self._poll_delay_ms)
+        self._poll_delay_ms = min(self._poll_delay_ms * 2, _CAMERA_POLL_MAX_MS)
     
     def _update_camera_status(self):
-        """Met à jour l'affichage du statut caméra"""
-        if self.camera_ready and self.selected_camera_alias:
-            self.camera_status_label.setText(f"✅ Caméra: {self.selected_camera_alias}")
-            self.camera_status_label.setStyleSheet("QLabel { color: green; font-weight: bold; }")
-            self.camera_alias_label.setText(f"Alias: {self.selected_camera_alias}")
-            self.camera_alias_label.setStyleSheet("QLabel { color: black; }")
-            
-            # Activation des boutons
-            self.start_tracking_btn.setEnabled(not self.is_tracking)
+        """Met à jour l'affichage du statut caméra (un seul repaint, rien si inchangé)"""
+        if not self._ui_built:
+            return  # Synchronisé à la construction du panneau
+        
+        ready = bool(self.camera_ready and self.selected_camera_alias)
+        if ready:
+            status_text = f"✅ Caméra: {self.selected_camera_alias}"
+            alias_text = f"Alias: {self.selected_camera_alias}"
+            status_color, alias_color = 'green', 'black'
         else:
-            self.camera_status_label.setText("❌ Aucune caméra active")
-            self.camera_status_label.setStyleSheet("QLabel { color: red; font-weight: bold; }")
-            self.camera_alias_label.setText("Alias: N/A")
-            self.camera_alias_label.setStyleSheet("QLabel { color: gray; }")
+            status_text = "❌ Aucune caméra active"
+            alias_text = "Alias: N/A"
+            status_color, alias_color = 'red', 'gray'
+        
+        # Regroupement des mises à jour dans un seul cycle de rendu
+        self.setUpdatesEnabled(False)
+        try:
+            if status_text != self.camera_status_label.text():
+                self.camera_status_label.setText(status_text)
+            if alias_text != self.camera_alias_label.text():
+                self.camera_alias_label.setText(alias_text)
             
-            # Désactivation des boutons
-            self.start_tracking_btn.setEnabled(False)
-            if self.is_tracking:
-                self._stop_tracking()
+            # setStyleSheet force un recalcul de style : uniquement sur changement d'état
+            if status_color != self._last_status_color:
+                self.camera_status_label.setStyleSheet(f"QLabel {{ color: {status_color}; font-weight: bold; }}")
+                self.camera_alias_label.setStyleSheet(f"QLabel {{ color: {alias_color}; }}")
+                self._last_status_color = status_color
+            
+            # Activation/désactivation des boutons
+            self.start_tracking_btn.setEnabled(ready and not self.is_tracking)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        if not ready and self.is_tracking:
+            self._stop_tracking()
     
     def _on_streaming_started(self):
         """Slot appelé quand le streaming démarre"""
@@ -573,17 +1297,33 @@ class TargetTab(QWidget):
         
         # Démarrer le traitement des frames si caméra prête
         if self.camera_ready and self.selected_camera_alias:
+            self._ensure_control_panel()
+            self._stop_frame_producer()
             fps_target = self.fps_spin.value()
-            interval_ms = int(1000 / fps_target)
-            self.processing_timer.start(interval_ms)
+            self._frame_producer = FrameProducer(self._get_frame, self._is_open, self.selected_camera_alias,
+                                                 int(1000 / fps_target), self)
+            self._frame_producer.frame_ready.connect(self._on_new_frame)
+            self._frame_producer.camera_lost.connect(self._check_camera_status)
+            self._frame_producer.start()
+            self._display_timer.start()
             logger.info(f"🎬 Traitement frames démarré à {fps_target}fps")
     
+    def _stop_frame_producer(self):
+        """Arrête le thread d'acquisition s'il tourne"""
+        if self._frame_producer is not None:
+            producer, self._frame_producer = self._frame_producer, None
+            if not producer.stop():
+                producer.frame_ready.disconnect(self._on_new_frame)
+                producer.camera_lost.disconnect(self._check_camera_status)
+                _linger_until_finished(producer)
+    
     def _on_streaming_stopped(self):
         """Slot appelé quand le streaming s'arrête"""
         logger.info("⏹️ Signal streaming arrêté reçu")
         
-        # Arrêt du processing
-        self.processing_timer.stop()
+        # Arrêt de l'acquisition et du rendu cadencé
+        self._stop_frame_producer()
+        self._display_timer.stop()
         if self.is_tracking:
             self._stop_tracking()
         
@@ -595,333 +1335,517 @@ class TargetTab(QWidget):
     
     # === MÉTHODES DE TRAITEMENT ===
     
-    def _process_current_frame(self):
-        """Traite la frame courante avec optimisations performance - Version améliorée"""
-        if not self.camera_ready or not self.selected_camera_alias:
+    def _on_new_frame(self):
+        """Traite la dernière frame déposée par le thread d'acquisition (affichage + soumission détection)"""
+        if not self.camera_ready or self._frame_producer is None:
+            return
+        
+        latest = self._frame_producer.take_latest()
+        if latest is None:
             return
+        frame, depth_frame = latest
 
         start_time = time.time()
 
         try:
-            # FIX: Récupération frame avec gestion d'erreur améliorée
-            if hasattr(self.camera_manager, 'get_camera_frame'):
-                success, frame, depth_frame = self.camera_manager.get_camera_frame(self.selected_camera_alias)
-            elif hasattr(self.camera_manager, 'get_latest_frame'):
-                # Fallback si méthode différente
-                result = self.camera_manager.get_latest_frame()
-                if isinstance(result, tuple) and len(result) >= 2:
-                    success, frame = result[0], result[1]
-                    depth_frame = result[2] if len(result) > 2 else None
-                else:
-                    success, frame, depth_frame = False, None, None
+            previous_frame = self.current_frame
+            previous_pooled = self._current_frame_pooled
+            
+            if self.is_tracking:
+                # Copie dans un buffer recyclé : le worker de détection le conserve
+                frame_buf = self._frame_pool.acquire(frame.shape, frame.dtype)
+                np.copyto(frame_buf, frame)
+                self.current_frame = frame_buf
             else:
-                logger.warning("⚠️ Aucune méthode de récupération frame disponible")
-                return
-
-            if success and frame is not None:
-                self.current_frame = frame.copy()
-                self.current_depth_frame = depth_frame
-
-                # Traitement de détection SEULEMENT si tracking actif
-                if self.is_tracking:
-                    # Skip detection si frame précédente pas encore traitée
-                    if not hasattr(self, '_processing_detection') or not self._processing_detection:
-                        self._detect_targets_in_frame()
+                # Affichage seul : la frame de la caméra est lue sans copie
+                self.current_frame = frame
+            self._current_frame_pooled = self.is_tracking
+            self.current_depth_frame = depth_frame
+            self._frame_seq += 1
+            
+            # L'ancien buffer revient au pool sauf s'il est encore en détection
+            if (previous_pooled and previous_frame is not None
+                    and not self._is_frame_inflight(previous_frame)):
+                self._frame_pool.release(previous_frame)
 
-                # Affichage avec overlays
-                self._update_display()
+            # Traitement de détection SEULEMENT si tracking actif
+            if self.is_tracking:
+                # File bornée côté worker : les frames en retard sont abandonnées
+                self._detect_targets_in_frame()
 
-                # Mesure performance réelle
-                processing_time = (time.time() - start_time) * 1000  # ms
-                if processing_time > 50:  # Plus de 50ms = problématique
-                    logger.debug(f"⚠️ Frame lente: {processing_time:.1f}ms")
+            # Affichage différé au prochain tick du timer d'affichage
+            self._display_dirty = True
 
-            else:
-                # Vérification si caméra toujours disponible
-                if hasattr(self.camera_manager, 'is_camera_open'):
-                    if not self.camera_manager.is_camera_open(self.selected_camera_alias):
-                        logger.warning(f"⚠️ Caméra {self.selected_camera_alias} non disponible")
-                        self._check_camera_status()
+            # Mesure performance réelle
+            processing_time = (time.time() - start_time) * 1000  # ms
+            if processing_time > 50 and logger.isEnabledFor(logging.DEBUG):  # Plus de 50ms = problématique
+                logger.debug("⚠️ Frame lente: %.1fms", processing_time)
+            self._adapt_capture_interval(processing_time)
                 
         except Exception as e:
-            logger.error(f"❌ Erreur traitement frame: {e}")
+            logger.error("❌ Erreur traitement frame: %s", e)
             # Force re-vérification état caméra
             self._check_camera_status()
     
     def _detect_targets_in_frame(self):
-        """Effectue la détection des cibles dans la frame courante - Version améliorée"""
+        """Soumet la frame courante au worker de détection (latence bornée à 2 frames)"""
         if self.current_frame is None:
             return
 
-        # Protection contre traitement concurrent
-        if hasattr(self, '_processing_detection') and self._processing_detection:
+        # AMÉLIORATION: Validation du détecteur avant utilisation
+        if not hasattr(self.target_detector, 'detect_all_targets'):
+            logger.warning("⚠️ Méthode detect_all_targets non disponible")
             return
 
-        self._processing_detection = True
+        # Prêt du buffer au worker sans copie : vue en lecture seule + jeton de restitution
+        pool_token = self._frame_seq
+        self._inflight_frames[pool_token] = self.current_frame
+        frame_view = self.current_frame.view()
+        frame_view.flags.writeable = False
+        dropped_token, queue_depth = self._detection_worker.submit(
+            pool_token, frame_view, self._effective_detection_scale(frame_view)
+        )
+        
+        # Frame abandonnée par la file : son buffer est rendu immédiatement
+        if dropped_token is not None:
+            self.detection_stats['frames_dropped'] += 1
+            self._status_dirty = True
+            self._on_frame_released(dropped_token)
+        if queue_depth > self.detection_stats['queue_high_water']:
+            self.detection_stats['queue_high_water'] = queue_depth
+            self._status_dirty = True
+    
+    def _effective_detection_scale(self, frame) -> float:
+        """Échelle adaptative plafonnée par le plus grand côté autorisé"""
+        scale = self._detection_scale
+        if self._max_detection_side > 0:
+            longest_side = max(frame.shape[:2])
+            if longest_side > self._max_detection_side:
+                scale = min(scale, self._max_detection_side / longest_side)
+        return scale
+    
+    def _is_frame_inflight(self, frame) -> bool:
+        """Vrai si le buffer est encore prêté au worker de détection"""
+        return any(buf is frame for buf in self._inflight_frames.values())
+    
+    def _on_frame_released(self, pool_token: int):
+        """Slot GUI : le worker a rendu le buffer, retour au pool s'il n'est plus affiché"""
+        done_frame = self._inflight_frames.pop(pool_token, None)
+        if done_frame is not None and done_frame is not self.current_frame:
+            self._frame_pool.release(done_frame)
+    
+    def _on_targets_ready(self, detected_results, frame_size):
+        """Slot GUI : filtrage ROI, statistiques et diffusion des détections du worker"""
+        self._status_dirty = True
+        
+        if not self.is_tracking:
+            return
 
         try:
-            # AMÉLIORATION: Validation du détecteur avant utilisation
-            if not hasattr(self.target_detector, 'detect_all_targets'):
-                logger.warning("⚠️ Méthode detect_all_targets non disponible")
-                return
-
-            # Détection avec timeout
-            import signal
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Détection timeout")
-            
-            # Détection avec protection timeout (Linux/Mac uniquement)
-            try:
-                if hasattr(signal, 'SIGALRM'):  # Unix systems
-                    signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(1)  # 1 seconde max
-                
-                detected_results = self.target_detector.detect_all_targets(self.current_frame)
-                
-                if hasattr(signal, 'SIGALRM'):
-                    signal.alarm(0)  # Cancel timeout
-                    
-            except TimeoutError:
-                logger.warning("⚠️ Détection timeout, frame skippée")
-                detected_results = []
-            except Exception as detection_error:
-                logger.error(f"❌ Erreur détection: {detection_error}")
-                detected_results = []
-
-            # Validation du résultat
-            if not isinstance(detected_results, list):
-                logger.warning(f"⚠️ Format retour détection invalide: {type(detected_results)}")
-                detected_results = []
-
             # Filtrage par ROI si actives
-            if hasattr(self.roi_manager, 'has_active_rois') and self.roi_manager.has_active_rois():
-                filtered_detections = []
-                for detection in detected_results:
-                    if hasattr(detection, 'center') and hasattr(self.roi_manager, 'point_in_any_active_roi'):
-                        if self.roi_manager.point_in_any_active_roi(detection.center):
-                            filtered_detections.append(detection)
-                detected_results = filtered_detections
+            if (detected_results and hasattr(self.roi_manager, 'has_active_rois')
+                    and self.roi_manager.has_active_rois()):
+                if hasattr(self.roi_manager, 'points_in_active_rois'):
+                    # Un seul test vectorisé sur le masque des ROI (mis en cache par le manager)
+                    centers = np.array([d.center for d in detected_results], dtype=np.int32)
+                    keep = self.roi_manager.points_in_active_rois(centers, frame_size)
+                    detected_results = list(compress(detected_results, keep.tolist()))
+                else:
+                    detected_results = [d for d in detected_results
+                                        if self.roi_manager.point_in_any_active_roi(d.center)]
 
+            # Overlays redessinés au prochain tick d'affichage
+            self._display_dirty = True
+            
             # Conversion des résultats pour compatibilité
-            self.detected_targets = detected_results
+            self.detected_targets.clear()
+            self.detected_targets.extend(detected_results)
+            self._n_targets = len(self.detected_targets)
 
             # Création des infos de détection
             detection_info = {
-                'frame_size': self.current_frame.shape[:2],
+                'frame_size': frame_size,
                 'detection_count': len(detected_results),
-                'detection_time': time.time(),
-                'target_types': []
+                'detection_time': time.time()
             }
             
-            # Extraction sécurisée des types
+            # Types présents sous forme de bits (liste de noms construite au rafraîchissement)
+            type_bits = 0
             for result in detected_results:
-                if hasattr(result, 'target_type'):
-                    if hasattr(result.target_type, 'value'):
-                        detection_info['target_types'].append(result.target_type.value)
-                    else:
-                        detection_info['target_types'].append(str(result.target_type))
+                type_bits |= _TARGET_TYPE_BITS.get(result.target_type, 0)
+            self._last_type_bits = type_bits
+
+            # Compteurs par type : une seule mise à jour vectorisée par frame
+            soa = self._detections_soa(detected_results)
+            if detected_results:
+                np.add.at(self._stats_arr, soa['types'][soa['types'] != StatIdx.EMPTY], 1)
+            else:
+                self._stats_arr[StatIdx.EMPTY] += 1
+
+            # Historique de tracking (colonnes NumPy)
+            if detected_results:
+                self._append_tracking_history(detected_results, detection_info['detection_time'])
 
             # Mise à jour des statistiques
             self._update_detection_stats(detection_info)
+            self._adapt_detection_scale()
 
             # Émission du signal pour autres onglets
             if detected_results:
                 self.target_detected.emit({
-                    'targets': detected_results,
+                    'targets': detected_results,  # Objets conservés pour les consommateurs existants
+                    'arrays': soa,
                     'frame_info': detection_info,
                     'timestamp': time.time()
                 })
 
         except Exception as e:
-            logger.error(f"❌ Erreur détection globale: {e}")
-        finally:
-            self._processing_detection = False
+            logger.error("❌ Erreur détection globale: %s", e)
+    
+    @staticmethod
+    def _detections_soa(detections) -> Dict[str, np.ndarray]:
+        """Détections en colonnes NumPy : centers (N,2) int32, sizes (N,) float32, ids (N,) int32, types (N,) uint8 (StatIdx)"""
+        return {
+            'centers': np.array([d.center for d in detections], dtype=np.int32).reshape(-1, 2),
+            'sizes': np.fromiter((d.size for d in detections), dtype=np.float32, count=len(detections)),
+            'ids': np.fromiter((d.id for d in detections), dtype=np.int32, count=len(detections)),
+            'types': np.fromiter((_TARGET_STAT_IDX.get(d.target_type, StatIdx.EMPTY) for d in detections),
+                                 dtype=np.uint8, count=len(detections)),
+        }
+    
+    def _overlay_state(self):
+        """Signature des overlays courants (cibles, ROI, zoom) pour détecter un changement"""
+        try:
+            targets = tuple(
+                (t.target_type, t.id, t.center, t.size, t.rotation) for t in self.detected_targets
+            )
+            rois = tuple((roi.name, roi.active, len(roi.points)) for roi in self.roi_manager.rois)
+            return (targets, rois, self.zoom_slider.value(), self.zoom_slider.isSliderDown(),
+                    self.depth_view_check.isChecked(), self.depth_colormap_check.isChecked())
+        except Exception:
+            return None  # Signature indisponible : toujours redessiner
+    
+    def _adapt_detection_scale(self):
+        """Ajuste l'échelle de détection (AIMD) selon le FPS mesuré vs le FPS cible"""
+        measured_fps = self.detection_stats['fps']
+        if measured_fps <= 0:
+            return
+        
+        target_fps = self.fps_spin.value()
+        min_scale = self._safe_get_config('tracking', 'target_detection.min_detection_scale', 0.25)
+        
+        if measured_fps < 0.9 * target_fps:
+            # Décroissance multiplicative dès que la cadence décroche
+            self._detection_scale = max(min_scale, self._detection_scale * 0.8)
+            self._fast_ticks = 0
+        elif measured_fps > 1.05 * target_fps and self._detection_scale < 1.0:
+            # Remontée prudente après 30 ticks confortables
+            self._fast_ticks += 1
+            if self._fast_ticks >= 30:
+                self._detection_scale = min(1.0, self._detection_scale * 1.1)
+                self._fast_ticks = 0
+        else:
+            self._fast_ticks = 0
+    
+    def _mark_display_dirty(self, *_):
+        """Demande un rendu au prochain tick du timer d'affichage"""
+        self._display_dirty = True
+    
+    def _on_display_tick(self):
+        """Tick du timer d'affichage (~30 Hz) : rendu seulement si frame ou overlays ont changé"""
+        if self._display_dirty:
+            self._update_display()
     
     def _update_display(self):
         """Met à jour l'affichage avec la frame et les overlays"""
+        self._display_dirty = False
         if self.current_frame is None:
             return
         
+        # Rien à redessiner si ni la frame ni les overlays n'ont changé
+        overlay_state = self._overlay_state()
+        if (overlay_state is not None and self._frame_seq == self._last_displayed_seq
+                and overlay_state == self._last_overlay_state):
+            return
+        
         try:
-            display_frame = self.current_frame.copy()
-            
-            # Ajout des overlays
-            self._draw_overlays(display_frame)
-            
-            # Conversion pour affichage Qt
-            height, width, channel = display_frame.shape
-            bytes_per_line = 3 * width
-            q_image = QImage(display_frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888).rgbSwapped()
+            if self.depth_view_check.isChecked() and self.current_depth_frame is not None:
+                # Profondeur : mono-canal uint8 (3× moins de données que RGB888)
+                q_image = self._depth_to_qimage(self.current_depth_frame)
+                source = self._depth_buf
+            elif not self._has_overlays():
+                # Aucun overlay : la frame est affichée sans copie (QPixmap.fromImage copie déjà)
+                source = self.current_frame
+                height, width = source.shape[:2]
+                q_image = QImage(source.data, width, height, source.strides[0],
+                                 QImage.Format.Format_BGR888)
+            else:
+                # Tampon unique réutilisé : le pixmap affiché est une copie faite par fromImage
+                display_frame, q_image = self._display_buffer(self.current_frame)
+                np.copyto(display_frame, self.current_frame)
+                
+                # Ajout des overlays
+                self._draw_overlays(display_frame)
+                source = display_frame
             
-            # Application du zoom
+            # Application du zoom : aperçu redimensionné par OpenCV dans un buffer réutilisé
             zoom_factor = self.zoom_slider.value() / 100.0
             if zoom_factor != 1.0:
-                q_image = q_image.scaled(int(width * zoom_factor), int(height * zoom_factor), 
-                                       Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                q_image = self._scaled_preview(source, q_image.format(), zoom_factor)
             
             pixmap = QPixmap.fromImage(q_image)
             self.camera_display.setPixmap(pixmap)
             
+            self._last_displayed_seq = self._frame_seq
+            self._last_overlay_state = overlay_state
+            
         except Exception as e:
-            logger.error(f"❌ Erreur affichage: {e}")
+            logger.error("❌ Erreur affichage: %s", e)
+    
+    def _scaled_preview(self, source, image_format, zoom_factor: float):
+        """Redimensionne l'aperçu (cv2.resize vers un buffer persistant) et retourne son QImage"""
+        height, width = source.shape[:2]
+        preview_shape = (max(1, int(height * zoom_factor)), max(1, int(width * zoom_factor))) + source.shape[2:]
+        
+        # Réallocation seulement au changement de taille d'aperçu ou de format
+        if (self._preview_buf is None or self._preview_buf.shape != preview_shape
+                or self._preview_image.format() != image_format):
+            self._preview_buf = np.empty(preview_shape, dtype=np.uint8)
+            self._preview_image = QImage(self._preview_buf.data, preview_shape[1], preview_shape[0],
+                                         self._preview_buf.strides[0], image_format)
+        
+        # Rendu rapide en tracking live ou pendant le glissement, lissé seulement à l'arrêt
+        if self.is_tracking or self.zoom_slider.isSliderDown():
+            interpolation = cv2.INTER_NEAREST
+        else:
+            interpolation = cv2.INTER_AREA if zoom_factor < 1.0 else cv2.INTER_LINEAR
+        cv2.resize(source, (preview_shape[1], preview_shape[0]), dst=self._preview_buf,
+                   interpolation=interpolation)
+        return self._preview_image
+    
+    def _display_buffer(self, frame):
+        """Retourne le buffer d'affichage et son QImage, recréés seulement au changement de résolution"""
+        if self._display_buf is None or self._display_buf.shape != frame.shape:
+            height, width = frame.shape[:2]
+            self._display_buf = np.empty(frame.shape, dtype=np.uint8)
+            self._display_image = QImage(self._display_buf.data, width, height,
+                                         self._display_buf.strides[0], QImage.Format.Format_BGR888)
+        return self._display_buf, self._display_image
+    
+    def _depth_to_qimage(self, depth):
+        """Convertit la profondeur en QImage Grayscale8 (palette seulement si demandée)"""
+        max_depth = float(depth.max()) if depth.size else 0.0
+        alpha = 255.0 / max_depth if max_depth > 0 else 0.0
+        self._depth_buf = cv2.convertScaleAbs(depth, alpha=alpha)
+        
+        height, width = self._depth_buf.shape[:2]
+        if self.depth_colormap_check.isChecked():
+            self._depth_buf = cv2.applyColorMap(self._depth_buf, cv2.COLORMAP_JET)
+            return QImage(self._depth_buf.data, width, height, self._depth_buf.strides[0],
+                          QImage.Format.Format_BGR888)
+        
+        return QImage(self._depth_buf.data, width, height, self._depth_buf.strides[0],
+                      QImage.Format.Format_Grayscale8)
+    
+    @staticmethod
+    def _aruco_axis_endpoints(targets) -> np.ndarray:
+        """Extrémités (N, 3, 2) int32 des axes X, Y, Z des marqueurs ArUco, calculées en un lot"""
+        if not targets:
+            return np.empty((0, 3, 2), dtype=np.int32)
+        
+        centers = np.array([t.center for t in targets], dtype=np.float64)
+        rotations = np.array([t.rotation for t in targets], dtype=np.float64)
+        sizes = np.array([t.size for t in targets], dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            return _axis_endpoints_kernel(centers, rotations, sizes)
+        
+        # Repli NumPy vectorisé
+        rad = np.deg2rad(rotations)
+        axis_len = (sizes * 0.4).astype(np.int32)
+        cos, sin = np.cos(rad), np.sin(rad)
+        
+        x_ends = centers + np.stack((axis_len * cos, axis_len * sin), axis=-1)
+        y_ends = centers + np.stack((-axis_len * sin, axis_len * cos), axis=-1)
+        z_ends = centers - ((axis_len * 0.6).astype(np.int32) // 4)[:, None]
+        return np.stack((x_ends, y_ends, z_ends), axis=1).astype(np.int32)
+    
+    def _text_size(self, text: str, font: int, font_scale: float, thickness: int) -> Tuple[int, int]:
+        """cv2.getTextSize mémoïsé : les étiquettes (« ID:5 »…) se répètent d'une frame à l'autre"""
+        key = (text, font, font_scale, thickness)
+        size = self._text_size_cache.get(key)
+        if size is None:
+            size = self._text_size_cache[key] = cv2.getTextSize(text, font, font_scale, thickness)[0]
+        return size
+    
+    @staticmethod
+    def _blend_label_background(frame, top_left, bottom_right, alpha: float = 0.7):
+        """Mélange _LABEL_BG_COLOR à alpha sur le seul rectangle (bornes incluses) de l'étiquette"""
+        height, width = frame.shape[:2]
+        x0, y0 = max(0, top_left[0]), max(0, top_left[1])
+        x1, y1 = min(width, bottom_right[0] + 1), min(height, bottom_right[1] + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        roi = frame[y0:y1, x0:x1]
+        cv2.addWeighted(np.full_like(roi, _LABEL_BG_COLOR), alpha, roi, 1.0 - alpha, 0, dst=roi)
+    
+    def _has_overlays(self) -> bool:
+        """Vrai s'il y a des cibles détectées ou des ROI à dessiner"""
+        return bool(self.detected_targets or self.roi_manager.rois)
     
     def _draw_overlays(self, frame):
         """Dessine les overlays sur la frame"""
-        if not hasattr(self, 'detected_targets'):
+        if not self._has_overlays():
             return
         
         # ROI actives
         for roi in self.roi_manager.rois:
-            color = (0, 255, 255)  # Jaune
+            color = _ROI_COLOR
             thickness = 2
             # Dessiner selon le type de ROI (rectangle, polygone, etc.)
             # TODO: Implémenter dessin ROI
         
-        # Cibles détectées
+        # Cibles regroupées par type : une entrée de table de dispatch par groupe
+        groups = {}
         for target in self.detected_targets:
+            groups.setdefault(target.target_type, []).append(target)
+        
+        for target_type, targets in groups.items():
+            draw = self._draw_dispatch.get(target_type)
+            if draw is not None:
+                draw(frame, targets)
+    
+    def _draw_aruco_targets(self, frame, targets):
+        """Marqueurs ArUco : contours, axes 3D, étiquette ID et centre"""
+        # Contours : un seul appel cv2.polylines pour tous les marqueurs
+        # (anticrénelage seulement en vue réduite, où l'image est sous-échantillonnée)
+        # Tous les coins empilés en un seul tableau (N, 4, 2) int32 : une allocation par frame
+        quads = [t.corners for t in targets if len(t.corners) == 4]
+        if quads:
+            contours = np.array(quads, dtype=np.int32)
+            line_type = cv2.LINE_AA if self.zoom_slider.value() < 100 else cv2.LINE_8
+            cv2.polylines(frame, contours, True, _ARUCO_CONTOUR_COLOR, 2, line_type)
+        
+        # Extrémités des axes X/Y/Z de tous les marqueurs, calculées en un lot
+        axes = self._aruco_axis_endpoints(targets).tolist()
+        
+        # Fonctions OpenCV liées localement (évite la recherche d'attribut par appel)
+        arrow, put_text, circle = cv2.arrowedLine, cv2.putText, cv2.circle
+        text_size_of, blend = self._text_size, self._blend_label_background
+        font, font_scale, thickness = _LABEL_FONT, _ARUCO_LABEL_SCALE, _ARUCO_LABEL_THICKNESS
+        
+        for target, axis_ends in zip(targets, axes):
             try:
                 center = target.center
-                target_type = target.target_type
                 
-                if target_type == TargetType.ARUCO:
-                    # === MARQUEURS ARUCO ===
-                    
-                    # Contour du marqueur (carré)
-                    if len(target.corners) == 4:
-                        corners = np.array(target.corners, dtype=np.int32)
-                        cv2.polylines(frame, [corners], True, (0, 255, 0), 2)  # Vert
-                    
-                    # Axes 3D colorés
-                    axis_length = int(target.size * 0.4)
-                    rotation_rad = np.radians(target.rotation)
-                    
-                    # Axe X (Rouge)
-                    x_end = (
-                        int(center[0] + axis_length * np.cos(rotation_rad)),
-                        int(center[1] + axis_length * np.sin(rotation_rad))
-                    )
-                    cv2.arrowedLine(frame, center, x_end, (0, 0, 255), 3, tipLength=0.3)
-                    
-                    # Axe Y (Vert)
-                    y_end = (
-                        int(center[0] - axis_length * np.sin(rotation_rad)),
-                        int(center[1] + axis_length * np.cos(rotation_rad))
-                    )
-                    cv2.arrowedLine(frame, center, y_end, (0, 255, 0), 3, tipLength=0.3)
-                    
-                    # Axe Z (Bleu) - simulé
-                    z_offset = int(axis_length * 0.6)
-                    z_end = (center[0] - z_offset//4, center[1] - z_offset//4)
-                    cv2.arrowedLine(frame, center, z_end, (255, 0, 0), 3, tipLength=0.3)
-                    
-                    # ID du marqueur avec fond
-                    text = f"ID:{target.id}"
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 0.7
-                    thickness = 2
-                    
-                    # Taille du texte
-                    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
-                    text_x = center[0] - text_size[0] // 2
-                    text_y = center[1] - int(target.size * 0.6)
-                    
-                    # Fond blanc semi-transparent
-                    overlay = frame.copy()
-                    cv2.rectangle(overlay, 
-                                (text_x - 8, text_y - text_size[1] - 5),
-                                (text_x + text_size[0] + 8, text_y + 8),
-                                (255, 255, 255), -1)
-                    cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
-                    
-                    # Texte noir
-                    cv2.putText(frame, text, (text_x, text_y), 
-                            font, font_scale, (0, 0, 0), thickness)
-                    
-                    # Cercle central
-                    cv2.circle(frame, center, 4, (255, 255, 255), -1)
-                    cv2.circle(frame, center, 4, (0, 0, 0), 1)
-                    
-                elif target_type == TargetType.REFLECTIVE:
-                    # === MARQUEURS RÉFLÉCHISSANTS ===
-                    
-                    # Cercle principal
-                    radius = int(target.size / 2)
-                    cv2.circle(frame, center, radius, (0, 0, 255), 2)  # Rouge
-                    
-                    # Cercle interne
-                    cv2.circle(frame, center, radius//2, (0, 0, 255), 1)
-                    
-                    # Point central
-                    cv2.circle(frame, center, 3, (0, 0, 255), -1)
-                    
-                    # Croix de visée
-                    cross_size = radius + 10
-                    cv2.line(frame, 
-                            (center[0] - cross_size, center[1]), 
-                            (center[0] + cross_size, center[1]), 
-                            (0, 0, 255), 1)
-                    cv2.line(frame, 
-                            (center[0], center[1] - cross_size), 
-                            (center[0], center[1] + cross_size), 
-                            (0, 0, 255), 1)
-                    
-                    # Étiquette
-                    text = f"REF:{target.id}"
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 0.5
-                    cv2.putText(frame, text, 
-                            (center[0] - 30, center[1] - radius - 10), 
-                            font, font_scale, (0, 0, 255), 1)
-                    
-                elif target_type == TargetType.LED:
-                    # === MARQUEURS LED ===
-                    
-                    # Couleur selon les données additionnelles
-                    led_color = (0, 255, 255)  # Cyan par défaut
-                    if target.additional_data and 'color' in target.additional_data:
-                        color_name = target.additional_data['color']
-                        color_map = {
-                            'red': (0, 0, 255),
-                            'green': (0, 255, 0), 
-                            'blue': (255, 0, 0),
-                            'yellow': (0, 255, 255),
-                            'cyan': (255, 255, 0),
-                            'magenta': (255, 0, 255)
-                        }
-                        led_color = color_map.get(color_name, (0, 255, 255))
-                    
-                    # Cercle LED avec effet de halo
-                    radius = int(target.size / 2)
-                    
-                    # Halo externe
-                    cv2.circle(frame, center, radius + 8, led_color, 1)
-                    cv2.circle(frame, center, radius + 4, led_color, 1)
-                    
-                    # Cercle principal
-                    cv2.circle(frame, center, radius, led_color, 2)
-                    
-                    # Centre brillant
-                    cv2.circle(frame, center, 2, (255, 255, 255), -1)
-                    
-                    # Étiquette colorée
-                    text = f"LED:{target.id}"
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 0.5
-                    
-                    # Fond coloré pour l'étiquette
-                    text_size = cv2.getTextSize(text, font, font_scale, 1)[0]
-                    label_pos = (center[0] - text_size[0]//2, center[1] + radius + 20)
-                    
-                    cv2.rectangle(frame,
-                                (label_pos[0] - 5, label_pos[1] - text_size[1] - 3),
-                                (label_pos[0] + text_size[0] + 5, label_pos[1] + 3),
-                                led_color, -1)
-                    
-                    cv2.putText(frame, text, label_pos,
-                            font, font_scale, (0, 0, 0), 1)
+                # Axes 3D colorés
+                x_end, y_end, z_end = (tuple(end) for end in axis_ends)
+                arrow(frame, center, x_end, _AXIS_X_COLOR, 3, tipLength=_AXIS_TIP_LENGTH)  # X (Rouge)
+                arrow(frame, center, y_end, _AXIS_Y_COLOR, 3, tipLength=_AXIS_TIP_LENGTH)  # Y (Vert)
+                arrow(frame, center, z_end, _AXIS_Z_COLOR, 3, tipLength=_AXIS_TIP_LENGTH)  # Z (Bleu) - simulé
+                
+                # ID du marqueur avec fond
+                text = f"ID:{target.id}"
+                
+                # Taille du texte
+                text_size = text_size_of(text, font, font_scale, thickness)
+                text_x = center[0] - text_size[0] // 2
+                text_y = center[1] - int(target.size * 0.6)
+                
+                # Fond blanc semi-transparent (mélange limité au rectangle de l'étiquette)
+                blend(frame,
+                      (text_x - 8, text_y - text_size[1] - 5),
+                      (text_x + text_size[0] + 8, text_y + 8))
+                
+                # Texte noir
+                put_text(frame, text, (text_x, text_y), 
+                        font, font_scale, _TEXT_COLOR, thickness)
+                
+                # Cercle central
+                circle(frame, center, 4, _LABEL_BG_COLOR, -1)
+                circle(frame, center, 4, _TEXT_COLOR, 1)
             except Exception as e:
-                logger.debug(f"Erreur overlay cible {target.id}: {e}")
-                continue
+                logger.debug("Erreur overlay cible %s: %s", target.id, e)
+    
+    def _draw_reflective_targets(self, frame, targets):
+        """Marqueurs réfléchissants : cercles, croix de visée et étiquette"""
+        circle, line, put_text = cv2.circle, cv2.line, cv2.putText
+        
+        for target in targets:
+            try:
+                center = target.center
+                
+                # Cercle principal
+                radius = int(target.size / 2)
+                circle(frame, center, radius, _REFLECTIVE_COLOR, 2)
+                
+                # Cercle interne
+                circle(frame, center, radius//2, _REFLECTIVE_COLOR, 1)
+                
+                # Point central
+                circle(frame, center, 3, _REFLECTIVE_COLOR, -1)
+                
+                # Croix de visée
+                cross_size = radius + 10
+                line(frame, 
+                        (center[0] - cross_size, center[1]), 
+                        (center[0] + cross_size, center[1]), 
+                        _REFLECTIVE_COLOR, 1)
+                line(frame, 
+                        (center[0], center[1] - cross_size), 
+                        (center[0], center[1] + cross_size), 
+                        _REFLECTIVE_COLOR, 1)
+                
+                # Étiquette
+                text = f"REF:{target.id}"
+                put_text(frame, text, 
+                        (center[0] - 30, center[1] - radius - 10), 
+                        _LABEL_FONT, _SMALL_LABEL_SCALE, _REFLECTIVE_COLOR, 1)
+            except Exception as e:
+                logger.debug("Erreur overlay cible %s: %s", target.id, e)
+    
+    def _draw_led_targets(self, frame, targets):
+        """Marqueurs LED : halo, cercle principal et étiquette colorée"""
+        circle, rectangle, put_text = cv2.circle, cv2.rectangle, cv2.putText
+        text_size_of = self._text_size
+        
+        for target in targets:
+            try:
+                center = target.center
+                
+                # Couleur selon les données additionnelles
+                led_color = _LED_DEFAULT_COLOR
+                if target.additional_data:
+                    led_color = _LED_COLOR_MAP.get(target.additional_data.get('color'), _LED_DEFAULT_COLOR)
+                
+                # Cercle LED avec effet de halo
+                radius = int(target.size / 2)
+                
+                # Halo externe : un seul anneau épais couvrant radius+4 → radius+8
+                circle(frame, center, radius + 6, led_color, 5, cv2.LINE_AA)
+                
+                # Cercle principal
+                circle(frame, center, radius, led_color, 2)
+                
+                # Centre brillant
+                circle(frame, center, 2, _LABEL_BG_COLOR, -1)
+                
+                # Étiquette colorée
+                text = f"LED:{target.id}"
+                
+                # Fond coloré pour l'étiquette
+                text_size = text_size_of(text, _LABEL_FONT, _SMALL_LABEL_SCALE, 1)
+                label_pos = (center[0] - text_size[0]//2, center[1] + radius + 20)
+                
+                rectangle(frame,
+                            (label_pos[0] - 5, label_pos[1] - text_size[1] - 3),
+                            (label_pos[0] + text_size[0] + 5, label_pos[1] + 3),
+                            led_color, -1)
+                
+                put_text(frame, text, label_pos,
+                        _LABEL_FONT, _SMALL_LABEL_SCALE, _TEXT_COLOR, 1)
+            except Exception as e:
+                logger.debug("Erreur overlay cible %s: %s", target.id, e)
     
     # === MÉTHODES UI CALLBACKS ===
     
@@ -937,44 +1861,17 @@ class TargetTab(QWidget):
         if folder:
             self._scan_aruco_folder(folder)
     
-    def _debug_aruco_files(self, folder_path):
-        """Debug les fichiers dans le dossier ArUco"""
-        try:
-            folder = Path(folder_path)
-            if not folder.exists():
-                logger.error(f"❌ Dossier inexistant: {folder_path}")
-                return
-            
-            logger.info(f"🔍 CONTENU du dossier {folder.name}:")
-            files = list(folder.glob("*"))
-            
-            for file in files[:10]:  # Limiter à 10 fichiers
-                if file.is_file():
-                    logger.info(f"  📄 Fichier: {file.name} ({file.suffix})")
-                else:
-                    logger.info(f"  📁 Dossier: {file.name}")
-            
-            if len(files) > 10:
-                logger.info(f"  ... et {len(files) - 10} autres éléments")
-                
-            # Fichiers images spécifiquement
-            image_files = []
-            for ext in ['.png', '.jpg', '.jpeg']:
-                image_files.extend(list(folder.glob(f"*{ext}")))
-            
-            logger.info(f"🖼️ FICHIERS IMAGES trouvés ({len(image_files)}):")
-            for img_file in image_files[:10]:
-                logger.info(f"  🖼️ {img_file.name}")
-                
-        except Exception as e:
-            logger.error(f"❌ Erreur debug fichiers: {e}")
-
     def _scan_aruco_folder(self, folder_path):
-        """Scan du dossier ArUco sélectionné - Version ultra-robuste"""
+        """Lance le scan du dossier ArUco sélectionné dans un worker du QThreadPool"""
         try:
             folder_path = Path(folder_path)
             logger.info(f"🔍 Scan ArUco: {folder_path}")
             
+            # Un seul scan à la fois
+            if self._aruco_scan_worker is not None:
+                logger.warning("⚠️ Scan ArUco déjà en cours, demande ignorée")
+                return
+            
             # Validation du dossier
             if not folder_path.exists():
                 logger.error(f"❌ Dossier inexistant: {folder_path}")
@@ -988,47 +1885,49 @@ class TargetTab(QWidget):
                 self.aruco_folder_label.setStyleSheet("QLabel { color: red; }")
                 return
 
-            # Debug des fichiers
-            self._debug_aruco_files(folder_path)
+            # Indication de progression + verrouillage des boutons pendant le scan
+            self.aruco_folder_label.setText(f"🔄 Scan en cours: {folder_path.name}")
+            self.aruco_folder_label.setStyleSheet("QLabel { color: gray; }")
+            self.select_aruco_btn.setEnabled(False)
+            self.rescan_btn.setEnabled(False)
             
-            # Scan avec gestion d'erreur robuste
-            detected_markers = {}
-            if hasattr(self.aruco_loader, 'scan_aruco_folder'):
-                try:
-                    detected_markers = self.aruco_loader.scan_aruco_folder(str(folder_path))
-                    if not isinstance(detected_markers, dict):
-                        logger.warning(f"⚠️ Format retour scan invalide: {type(detected_markers)}")
-                        detected_markers = {}
-                except Exception as scan_error:
-                    logger.error(f"❌ Erreur scan ArUco: {scan_error}")
-                    detected_markers = {}
-
-            # Validation avec gestion d'erreur
-            valid_count, issues = 0, []
-            if hasattr(self.aruco_loader, 'validate_markers'):
-                try:
-                    valid_count, issues = self.aruco_loader.validate_markers()
-                except Exception as validation_error:
-                    logger.warning(f"⚠️ Erreur validation: {validation_error}")
+            worker = ArUcoScanWorker(self.aruco_loader, str(folder_path))
+            worker.signals.finished.connect(self._on_aruco_scan_finished)
+            self._aruco_scan_worker = worker
+            QThreadPool.globalInstance().start(worker)
 
+        except Exception as e:
+            logger.error(f"❌ Erreur scan ArUco global: {e}")
+            self.aruco_folder_label.setText("❌ Erreur de scan")
+            self.aruco_folder_label.setStyleSheet("QLabel { color: red; }")
+            self.aruco_stats_label.setText("Marqueurs: Erreur")
+    
+    def _on_aruco_scan_finished(self, result: dict):
+        """Met à jour l'interface à la fin du scan ArUco (thread GUI)"""
+        self._aruco_scan_worker = None
+        self.select_aruco_btn.setEnabled(True)
+        
+        try:
+            folder_path = Path(result['folder_path'])
+            detected_markers = result['markers']
+            valid_count, issues = result['valid_count'], result['issues']
+            
             # Mise à jour affichage
             self.aruco_folder_label.setText(f"📁 {folder_path.name}")
             self.aruco_folder_label.setStyleSheet("QLabel { color: green; }")
 
             if detected_markers:
-                # Détection automatique du dictionnaire avec fallback
-                dict_type = "4X4_50"  # Valeur par défaut
-                if hasattr(self.aruco_loader, '_detect_common_dictionary'):
-                    try:
-                        dict_type = self.aruco_loader._detect_common_dictionary()
-                    except:
-                        logger.warning("⚠️ Détection dictionnaire échouée, utilisation 4X4_50")
-                
+                dict_type = result['dict_type']
                 self.aruco_stats_label.setText(f"Marqueurs: {len(detected_markers)} détectés ({dict_type})")
                 
                 # Mise à jour du détecteur avec validation
-                if (hasattr(self.target_detector, 'aruco_config') and 
-                    hasattr(self.target_detector, '_init_aruco_detector')):
+                if hasattr(self.target_detector, 'set_aruco_dictionary'):
+                    # Dictionnaire changé sur le détecteur existant (pas de reconstruction)
+                    self.target_detector.set_aruco_dictionary(dict_type)
+                elif (hasattr(self.target_detector, 'aruco_config') and 
+                    hasattr(self.target_detector, '_init_aruco_detector') and
+                    self.target_detector.aruco_config.get('dictionary_type') != dict_type):
+                    # Reconstruction seulement si le dictionnaire change réellement
                     try:
                         self.target_detector.aruco_config['dictionary_type'] = dict_type
                         logger.info(f"🎯 Dictionnaire mis à jour: {dict_type}")
@@ -1064,6 +1963,9 @@ class TargetTab(QWidget):
             if hasattr(self.aruco_loader, 'folder_path') and self.aruco_loader.folder_path:
                 folder_path = str(self.aruco_loader.folder_path)
                 logger.info(f"🔄 Re-scan ArUco: {folder_path}")
+                # Re-scan explicite : le manifeste en cache est ignoré
+                if hasattr(self.aruco_loader, 'invalidate_scan_cache'):
+                    self.aruco_loader.invalidate_scan_cache(folder_path)
                 self._scan_aruco_folder(folder_path)
             else:
                 logger.warning("⚠️ Aucun dossier ArUco à rescanner")
@@ -1151,18 +2053,9 @@ class TargetTab(QWidget):
         msg.setStandardButtons(QMessageBox.StandardButton.Ok)
         msg.exec()
 
-    def _show_aruco_advanced_config(self):
-        """Affiche la configuration avancée ArUco"""
-        if not hasattr(self.target_detector, 'aruco_config'):
-            QMessageBox.information(self, "Configuration", "Détecteur ArUco non initialisé")
-            return
-        
-        # Récupération de la configuration actuelle
-        config = self.target_detector.aruco_config.copy()
-        detection_params = config.get('detection_params', {})
-        
-        # Création d'une fenêtre de dialogue simple pour les paramètres principaux
-        from PyQt6.QtWidgets import QDialog, QFormLayout, QDoubleSpinBox, QSpinBox
+    def _build_aruco_advanced_dialog(self):
+        """Construit une seule fois le dialogue de configuration avancée ArUco"""
+        from PyQt6.QtWidgets import QDialog, QFormLayout, QDoubleSpinBox, QDialogButtonBox
         
         dialog = QDialog(self)
         dialog.setWindowTitle("Configuration ArUco Avancée")
@@ -1173,30 +2066,25 @@ class TargetTab(QWidget):
         # Paramètres principaux
         min_perimeter = QDoubleSpinBox()
         min_perimeter.setRange(0.001, 1.0)
-        min_perimeter.setValue(detection_params.get('minMarkerPerimeterRate', 0.03))
         min_perimeter.setSingleStep(0.01)
         min_perimeter.setDecimals(3)
         layout.addRow("Min Perimeter Rate:", min_perimeter)
         
         max_perimeter = QDoubleSpinBox()
         max_perimeter.setRange(1.0, 10.0)
-        max_perimeter.setValue(detection_params.get('maxMarkerPerimeterRate', 4.0))
         max_perimeter.setSingleStep(0.5)
         max_perimeter.setDecimals(1)
         layout.addRow("Max Perimeter Rate:", max_perimeter)
         
         win_size_min = QSpinBox()
         win_size_min.setRange(3, 50)
-        win_size_min.setValue(detection_params.get('adaptiveThreshWinSizeMin', 3))
         layout.addRow("Window Size Min:", win_size_min)
         
         win_size_max = QSpinBox()
         win_size_max.setRange(10, 100)
-        win_size_max.setValue(detection_params.get('adaptiveThreshWinSizeMax', 23))
         layout.addRow("Window Size Max:", win_size_max)
         
         # Boutons
-        from PyQt6.QtWidgets import QDialogButtonBox
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
@@ -1204,14 +2092,34 @@ class TargetTab(QWidget):
         buttons.rejected.connect(dialog.reject)
         layout.addRow(buttons)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        # Paramètre ArUco → (spinbox, valeur par défaut), relu à chaque ouverture
+        self._aruco_cfg_spins = {
+            'minMarkerPerimeterRate': (min_perimeter, 0.03),
+            'maxMarkerPerimeterRate': (max_perimeter, 4.0),
+            'adaptiveThreshWinSizeMin': (win_size_min, 3),
+            'adaptiveThreshWinSizeMax': (win_size_max, 23)
+        }
+        return dialog
+
+    def _show_aruco_advanced_config(self):
+        """Affiche la configuration avancée ArUco (dialogue construit au premier appel puis réutilisé)"""
+        if not hasattr(self.target_detector, 'aruco_config'):
+            QMessageBox.information(self, "Configuration", "Détecteur ArUco non initialisé")
+            return
+        
+        from PyQt6.QtWidgets import QDialog
+        
+        if self._aruco_cfg_dialog is None:
+            self._aruco_cfg_dialog = self._build_aruco_advanced_dialog()
+        
+        # Valeurs actuelles du détecteur reportées dans les spinboxes
+        detection_params = self.target_detector.aruco_config.get('detection_params', {})
+        for key, (spin, default) in self._aruco_cfg_spins.items():
+            spin.setValue(detection_params.get(key, default))
+        
+        if self._aruco_cfg_dialog.exec() == QDialog.DialogCode.Accepted:
             # Mise à jour des paramètres
-            new_params = {
-                'minMarkerPerimeterRate': min_perimeter.value(),
-                'maxMarkerPerimeterRate': max_perimeter.value(),
-                'adaptiveThreshWinSizeMin': win_size_min.value(),
-                'adaptiveThreshWinSizeMax': win_size_max.value()
-            }
+            new_params = {key: spin.value() for key, (spin, _) in self._aruco_cfg_spins.items()}
             
             # Mise à jour dans le détecteur
             if hasattr(self.target_detector, 'update_detection_params'):
@@ -1220,8 +2128,6 @@ class TargetTab(QWidget):
                 QMessageBox.information(self, "Configuration", "Paramètres ArUco mis à jour avec succès!")
             else:
                 logger.warning("⚠️ Impossible de mettre à jour les paramètres")
-        
-        dialog.deleteLater()
 
     def _on_detection_type_changed(self):
         """Callback changement types de détection"""
@@ -1265,7 +2171,7 @@ class TargetTab(QWidget):
         """Efface toutes les ROI"""
         try:
             roi_count = len(self.roi_manager.rois)
-            self.roi_manager.rois.clear()
+            self.roi_manager.clear_all_rois()
             self.roi_info_label.setText("ROI actives: 0")
             logger.info(f"🗑️ {roi_count} ROI effacées")
         except Exception as e:
@@ -1286,13 +2192,26 @@ class TargetTab(QWidget):
             self.export_btn.setEnabled(True)
             
             # Reset des données
-            self.detected_targets = []
-            self.tracking_history = []
+            self.detected_targets.clear()
+            self._n_targets = 0
+            self._reset_tracking_history()
             self.detection_stats = {
                 'total_detections': 0,
                 'fps': 0.0,
-                'last_detection_time': 0.0
+                'last_detection_time': 0.0,
+                'frames_dropped': 0,
+                'queue_high_water': 0,
+                'capture_fps': 0.0
             }
+            self._stats_arr[:] = 0
+            self._last_detection_time = 0.0
+            self._ewma_fps = 0.0
+            self._last_detection_count = 0
+            self._last_type_bits = 0
+            self._last_stats_values = None
+            self._status_dirty = True
+            
+            self.stats_timer.start(_STATS_REFRESH_MS)
             
             # Émission signal
             self.tracking_started.emit()
@@ -1308,6 +2227,10 @@ class TargetTab(QWidget):
         try:
             self.is_tracking = False
             
+            # Dernier état des statistiques puis arrêt du rafraîchissement
+            self.stats_timer.stop()
+            self._refresh_stats_text()
+            
             # Mise à jour UI
             self.start_tracking_btn.setEnabled(self.camera_ready)
             self.stop_tracking_btn.setEnabled(False)
@@ -1323,41 +2246,131 @@ class TargetTab(QWidget):
     def _on_zoom_changed(self, value):
         """Callback changement zoom"""
         self.zoom_label.setText(f"{value}%")
-        # Le redimensionnement se fait dans _update_display()
+        # Rendu différé : les événements rapprochés du slider sont regroupés
+        self._zoom_timer.start()
+    
+    def _do_zoom_update(self):
+        """Applique le zoom en attente"""
+        self._zoom_timer.stop()
+        self._display_dirty = True
+        self._update_display()
     
     def _update_detection_stats(self, detection_info):
         """Met à jour les statistiques de détection"""
         try:
             self.detection_stats['total_detections'] += detection_info.get('detection_count', 0)
-            current_time = time.time()
+            current_time = time.perf_counter()
             
-            # Calcul FPS
-            if self.detection_stats['last_detection_time'] > 0:
-                time_diff = current_time - self.detection_stats['last_detection_time']
+            # FPS en moyenne mobile exponentielle (évite la gigue du 1/dt instantané)
+            if self._last_detection_time:
+                time_diff = current_time - self._last_detection_time
                 if time_diff > 0:
-                    instant_fps = 1.0 / time_diff
-                    # Moyenne mobile
-                    alpha = 0.1
-                    self.detection_stats['fps'] = (
-                        alpha * instant_fps + (1 - alpha) * self.detection_stats['fps']
-                    )
-            
-            self.detection_stats['last_detection_time'] = current_time
+                    self._ewma_fps = 0.9 * self._ewma_fps + 0.1 * (1.0 / time_diff)
+                    self.detection_stats['fps'] = self._ewma_fps
             
-            # Mise à jour affichage
-            stats_text = f"""Détections totales: {self.detection_stats['total_detections']}
-FPS de détection: {self.detection_stats['fps']:.1f}
-Dernière détection: {detection_info.get('detection_count', 0)} cibles
-Types détectés: {', '.join(detection_info.get('target_types', []))}"""
+            self._last_detection_time = current_time
+            self.detection_stats['last_detection_time'] = detection_info.get('detection_time', time.time())
             
-            self.stats_text.setText(stats_text)
+            self._last_detection_count = detection_info.get('detection_count', 0)
             
         except Exception as e:
             logger.error(f"❌ Erreur mise à jour stats: {e}")
     
+    def _refresh_stats_text(self):
+        """Réécrit le panneau de statistiques (QTimer 1 Hz, jamais depuis le chemin par frame)"""
+        values = (self.detection_stats['total_detections'], round(self._ewma_fps, 1),
+                  round(self.detection_stats['capture_fps'], 1), self._last_detection_count,
+                  self._last_type_bits)
+        if values == self._last_stats_values:
+            return  # Rien n'a changé : pas de nouvelle mise en page Qt
+        self._last_stats_values = values
+        
+        type_names = [getattr(target_type, 'value', str(target_type))
+                      for target_type, bit in _TARGET_TYPE_BITS.items() if self._last_type_bits & bit]
+        self.stats_text.setPlainText("\n".join((
+            "Détections totales: %d" % values[0],
+            "FPS de détection: %.1f" % values[1],
+            "FPS acquisition effectif: %.1f" % values[2],
+            "Dernière détection: %d cibles" % values[3],
+            "Types détectés: " + ", ".join(type_names),
+        )))
+    
+    def _reset_tracking_history(self):
+        """Réinitialise l'historique de tracking (anneau borné à max_history lignes)"""
+        rows = min(_HISTORY_INITIAL_ROWS, self.max_history)
+        self._hist_t = np.empty(rows, dtype=np.float64)
+        self._hist_xyz = np.empty((rows, 3), dtype=np.float32)
+        self._hist_id = np.empty(rows, dtype=np.int32)
+        self._hist_n = 0
+        self._hist_head = 0  # Prochaine ligne écrite (revient à 0 une fois l'anneau plein)
+        self._status_dirty = True
+    
+    def _grow_tracking_history(self, new_capacity: int):
+        """Agrandit les colonnes de l'historique (avant le premier tour d'anneau)"""
+        self._hist_t = np.resize(self._hist_t, new_capacity)
+        self._hist_xyz = np.resize(self._hist_xyz, (new_capacity, 3))
+        self._hist_id = np.resize(self._hist_id, new_capacity)
+    
+    def _append_tracking_history(self, detections, timestamp):
+        """Ajoute les détections à l'historique, les plus anciennes écrasées au-delà de max_history"""
+        try:
+            depth = self.current_depth_frame
+            
+            for detection in detections:
+                # Croissance géométrique jusqu'à max_history (coût amorti O(1) par ligne)
+                capacity = len(self._hist_t)
+                if self._hist_n == capacity and capacity < self.max_history:
+                    self._grow_tracking_history(min(capacity * 2, self.max_history))
+                
+                x, y = detection.center
+                z = np.nan
+                if depth is not None:
+                    xi, yi = int(x), int(y)
+                    if 0 <= yi < depth.shape[0] and 0 <= xi < depth.shape[1]:
+                        z = depth[yi, xi]
+                
+                i = self._hist_head
+                self._hist_t[i] = timestamp
+                self._hist_xyz[i] = (x, y, z)
+                self._hist_id[i] = detection.id if isinstance(detection.id, (int, np.integer)) else -1
+                
+                self._hist_head = (i + 1) % self.max_history
+                self._hist_n = min(self._hist_n + 1, self.max_history)
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur ajout historique tracking: {e}")
+    
+    def _tracking_history_columns(self):
+        """Retourne (t, id, xyz) dans l'ordre chronologique"""
+        n = self._hist_n
+        columns = (self._hist_t, self._hist_id, self._hist_xyz)
+        if n < len(self._hist_t):
+            return tuple(column[:n] for column in columns)
+        
+        # Anneau plein : les plus anciennes lignes commencent à la tête d'écriture
+        head = self._hist_head
+        return tuple(np.concatenate((column[head:], column[:head])) for column in columns)
+    
+    def _set_max_history(self, max_history: int):
+        """Change la taille de l'anneau en conservant les points les plus récents"""
+        max_history = max(1, int(max_history))
+        t, ids, xyz = self._tracking_history_columns()
+        keep = min(len(t), max_history)
+        
+        self.max_history = max_history
+        self._reset_tracking_history()
+        if keep > len(self._hist_t):
+            self._grow_tracking_history(keep)
+        
+        self._hist_t[:keep] = t[len(t) - keep:]
+        self._hist_id[:keep] = ids[len(t) - keep:]
+        self._hist_xyz[:keep] = xyz[len(t) - keep:]
+        self._hist_n = keep
+        self._hist_head = keep % max_history
+    
     def _export_tracking_data(self):
         """Exporte les données de tracking"""
-        if not self.tracking_history:
+        if not self._hist_n:
             QMessageBox.information(self, "Export", "Aucune donnée de tracking à exporter")
             return
         
@@ -1366,50 +2379,172 @@ Types détectés: {', '.join(detection_info.get('target_types', []))}"""
             self, 
             "Exporter données de tracking", 
             f"tracking_data_{int(time.time())}.csv",
-            "CSV Files (*.csv);;JSON Files (*.json)"
+            "CSV Files (*.csv);;JSON Files (*.json);;NumPy Files (*.npz)"
         )
         
         if file_path:
             try:
-                # TODO: Implémenter export réel
+                n = self._hist_n
+                hist_t, hist_id, xyz = self._tracking_history_columns()
+                if file_path.lower().endswith('.npz'):
+                    # Colonnes NumPy écrites telles quelles (aucune conversion Python)
+                    np.savez_compressed(file_path, timestamp=hist_t, id=hist_id, xyz=xyz)
+                elif file_path.lower().endswith('.json'):
+                    import json
+                    data = {
+                        'timestamp': hist_t.tolist(),
+                        'id': hist_id.tolist(),
+                        'x': xyz[:, 0].tolist(),
+                        'y': xyz[:, 1].tolist(),
+                        'z': [None if np.isnan(v) else v for v in xyz[:, 2].tolist()]
+                    }
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f)
+                else:
+                    # Export colonne par colonne en un seul appel vectorisé
+                    table = np.column_stack((hist_t, hist_id, xyz))
+                    np.savetxt(file_path, table, delimiter=',',
+                               fmt=['%.6f', '%d', '%.3f', '%.3f', '%.3f'],
+                               header='timestamp,id,x,y,z', comments='')
+                
                 QMessageBox.information(self, "Export", f"Données exportées vers:\n{file_path}")
-                logger.info(f"💾 Données exportées: {file_path}")
+                logger.info(f"💾 {n} points exportés: {file_path}")
             except Exception as e:
                 logger.error(f"❌ Erreur export: {e}")
                 QMessageBox.critical(self, "Erreur Export", f"Impossible d'exporter:\n{e}")
     
     # === MÉTHODES PUBLIQUES POUR INTEGRATION ===
     
-    def get_tracking_status(self) -> dict:
-        """Retourne l'état actuel du tracking"""
-        return {
-            'is_tracking': self.is_tracking,
-            'camera_ready': self.camera_ready,
-            'selected_camera': self.selected_camera_alias,
-            'detected_targets': len(self.detected_targets),
-            'tracking_points': len(self.tracking_history),
-            'detection_stats': self.detection_stats
-        }
+    @property
+    def is_tracking(self) -> bool:
+        """Tracking en cours"""
+        return self._is_tracking
+    
+    @is_tracking.setter
+    def is_tracking(self, value: bool):
+        self._is_tracking = value
+        self._status_dirty = True
+    
+    @property
+    def camera_ready(self) -> bool:
+        """Caméra active disponible pour la détection"""
+        return self._camera_ready
+    
+    @camera_ready.setter
+    def camera_ready(self, value: bool):
+        self._camera_ready = value
+        self._status_dirty = True
+    
+    @property
+    def selected_camera_alias(self) -> Optional[str]:
+        """Alias de la caméra utilisée"""
+        return self._selected_camera_alias
+    
+    @selected_camera_alias.setter
+    def selected_camera_alias(self, value: Optional[str]):
+        self._selected_camera_alias = value
+        self._status_dirty = True
+        if getattr(self, '_frame_producer', None) is not None and value:
+            self._frame_producer.camera_alias = value
+    
+    def get_tracking_status(self) -> Dict:
+        """Retourne l'état actuel du tracking (dict propre à l'appelant)
+        
+        L'instantané n'est reconstruit qu'après un changement ; chaque appel en rend une copie,
+        dictionnaires imbriqués compris, que l'appelant peut modifier sans toucher au cache.
+        """
+        if self._status_dirty:
+            self._status_cache = {
+                'is_tracking': self.is_tracking,
+                'camera_ready': self.camera_ready,
+                'selected_camera': self.selected_camera_alias,
+                'detected_targets': self._n_targets,
+                'tracking_points': self._hist_n,
+                'detection_stats': dict(self.detection_stats),
+                'detections_by_type': {idx.name: int(self._stats_arr[idx]) for idx in StatIdx}
+            }
+            self._status_dirty = False
+        
+        status = dict(self._status_cache)
+        status['detection_stats'] = dict(status['detection_stats'])
+        status['detections_by_type'] = dict(status['detections_by_type'])
+        return status
     
     def set_detection_parameters(self, params: dict):
-        """Configure les paramètres de détection depuis l'extérieur"""
+        """Configure les paramètres de détection depuis l'extérieur (validés par _PARAM_SCHEMA)"""
+        self._ensure_control_panel()
+        
+        # Signaux bloqués pendant l'écriture : un seul parametersChanged au final
+        widgets = [self.fps_spin, self.confidence_spin,
+                   self.aruco_check, self.reflective_check, self.led_check]
+        for widget in widgets:
+            widget.blockSignals(True)
+        
+        applied = {}
         try:
-            if 'fps_target' in params:
-                self.fps_spin.setValue(params['fps_target'])
-            
-            if 'confidence_threshold' in params:
-                self.confidence_spin.setValue(params['confidence_threshold'])
-            
-            if 'detection_types' in params:
-                types = params['detection_types']
-                self.aruco_check.setChecked(types.get('aruco', True))
-                self.reflective_check.setChecked(types.get('reflective', True))
-                self.led_check.setChecked(types.get('led', False))
-            
-            logger.info("🔧 Paramètres de détection mis à jour")
-            
-        except Exception as e:
-            logger.error(f"❌ Erreur configuration paramètres: {e}")
+            for key, value in params.items():
+                spec = _PARAM_SCHEMA.get(key)
+                if spec is None:
+                    logger.warning(f"⚠️ Paramètre de détection inconnu: {key}")
+                    continue
+                
+                setter, expected_type, bounds = spec
+                if not isinstance(value, expected_type) or isinstance(value, bool):
+                    logger.warning(f"⚠️ Paramètre {key}: type invalide ({type(value).__name__})")
+                    continue
+                if bounds is not None and not bounds[0] <= value <= bounds[1]:
+                    logger.warning(f"⚠️ Paramètre {key}: {value} hors bornes {bounds}")
+                    continue
+                
+                setter(self, value)
+                applied[key] = value
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        
+        if applied:
+            self.parametersChanged.emit(applied)
+            logger.info(f"🔧 Paramètres de détection mis à jour: {', '.join(applied)}")
+    
+    def _apply_detection_types(self, types: dict):
+        """Coche les types de détection (signaux déjà bloqués par l'appelant)"""
+        self.aruco_check.setChecked(bool(types.get('aruco', True)))
+        self.reflective_check.setChecked(bool(types.get('reflective', True)))
+        self.led_check.setChecked(bool(types.get('led', False)))
+    
+    def _apply_tracking_stride(self, stride: int):
+        """Transmet le pas de détection complète au détecteur"""
+        if hasattr(self.target_detector, 'set_tracking_stride'):
+            self.target_detector.set_tracking_stride(stride)
+    
+    def _on_parameters_changed(self, params: dict):
+        """Applique en une fois les paramètres externes au pipeline de détection"""
+        if 'detection_types' in params:
+            self._on_detection_type_changed()
+        
+        if 'fps_target' in params:
+            self._on_fps_changed(self.fps_spin.value())
+    
+    def _adapt_capture_interval(self, processing_time: float):
+        """Élargit l'intervalle d'acquisition si le traitement GUI ne suit plus le FPS cible"""
+        self._proc_time_ema = 0.9 * self._proc_time_ema + 0.1 * processing_time
+        self._frames_since_throttle += 1
+        if self._frames_since_throttle < 30 or self._frame_producer is None:
+            return
+        
+        self._frames_since_throttle = 0
+        interval = max(int(1000 / self.fps_spin.value()), int(self._proc_time_ema * 1.2))
+        if interval != self._frame_producer.target_interval_ms:
+            self._frame_producer.target_interval_ms = interval
+        capture_fps = 1000.0 / interval
+        if capture_fps != self.detection_stats['capture_fps']:
+            self.detection_stats['capture_fps'] = capture_fps
+            self._status_dirty = True
+    
+    def _on_fps_changed(self, fps: int):
+        """Met à jour la cadence du thread d'acquisition"""
+        if self._frame_producer is not None:
+            self._frame_producer.target_interval_ms = int(1000 / fps)
     
     def force_camera_refresh(self):
         """Force la vérification de l'état des caméras"""
@@ -1417,63 +2552,68 @@ Types détectés: {', '.join(detection_info.get('target_types', []))}"""
 
     def _validate_component_methods(self):
         """Valide que tous les composants ont les méthodes requises"""
-        validation_results = {
-            'aruco_loader': True,
-            'target_detector': True, 
-            'roi_manager': True
-        }
+        validation_results = {}
         
-        # Validation ArUcoConfigLoader
-        required_aruco_methods = [
-            'scan_aruco_folder', 'get_latest_aruco_folder', 
-            'get_detector_params', 'validate_markers'
-        ]
-        for method in required_aruco_methods:
-            if not hasattr(self.aruco_loader, method):
-                logger.warning(f"⚠️ ArUcoConfigLoader.{method} manquant")
-                validation_results['aruco_loader'] = False
-        
-        # Validation TargetDetector
-        required_detector_methods = [
-            'detect_all_targets', 'set_detection_enabled', 
-            'set_roi', '_init_aruco_detector'
-        ]
-        for method in required_detector_methods:
-            if not hasattr(self.target_detector, method):
-                logger.warning(f"⚠️ TargetDetector.{method} manquant")
-                validation_results['target_detector'] = False
-        
-        # Validation ROIManager
-        required_roi_methods = [
-            'start_roi_creation', 'get_active_rois', 
-            'has_active_rois', 'draw_rois_on_frame'
-        ]
-        for method in required_roi_methods:
-            if not hasattr(self.roi_manager, method):
-                logger.warning(f"⚠️ ROIManager.{method} manquant")
-                validation_results['roi_manager'] = False
+        # Un seul dir() par composant, puis différence avec les méthodes requises
+        for attr_name, (class_name, required_methods) in _REQUIRED_COMPONENT_METHODS.items():
+            missing = required_methods.difference(dir(getattr(self, attr_name)))
+            for method in sorted(missing):
+                logger.warning(f"⚠️ {class_name}.{method} manquant")
+            validation_results[attr_name] = not missing
         
         return validation_results
     
     # === NETTOYAGE ===
     
-    def closeEvent(self, event):
-        """Nettoyage lors de la fermeture"""
+    def cleanup(self):
+        """Libère les ressources de l'onglet (timers, thread de détection)"""
+        # Arrêt des timers hors du try : stop() est sans effet sur un timer déjà arrêté,
+        # inutile d'interroger isActive(), et une erreur plus bas ne les laisse pas tourner
+        for timer in (self.camera_check_timer, self.stats_timer, self._display_timer):
+            timer.stop()
+        
         try:
-            # Arrêt des timers
-            if self.processing_timer.isActive():
-                self.processing_timer.stop()
-            
-            if self.camera_check_timer.isActive():
-                self.camera_check_timer.stop()
+            # Arrêt de l'acquisition
+            self._stop_frame_producer()
             
             # Arrêt tracking si actif
             if self.is_tracking:
                 self._stop_tracking()
             
+            # Arrêt du thread de détection borné à 200 ms (frames en attente abandonnées) ;
+            # l'attente du résultat est découpée en tranches de 50 ms, le worker sort dans ce délai
+            worker_stopped = True
+            if self._detection_worker.isRunning():
+                self._detection_worker.requestInterruption()
+                self._detection_worker.stop()
+                worker_stopped = self._detection_worker.wait(200)
+                if not worker_stopped:
+                    logger.warning("⚠️ Worker de détection toujours actif après 200 ms")
+                    self._detach_detection_worker()
+            
+            # Libération des données de tracking
+            self.detected_targets.clear()
+            self._n_targets = 0
+            self._reset_tracking_history()
+            
+            # Buffers de frames : seulement si le worker est arrêté, sinon il peut encore lire une frame prêtée
+            if worker_stopped:
+                self._inflight_frames.clear()
+                self._frame_pool.drain()
+            
             logger.info("🧹 TargetTab fermé proprement")
             
         except Exception as e:
             logger.error(f"❌ Erreur fermeture TargetTab: {e}")
-        
-        super().closeEvent(event)
\ No newline at end of file
+    
+    def _detach_detection_worker(self):
+        """Déconnecte le worker encore actif de l'onglet, détruit sur son signal finished"""
+        worker = self._detection_worker
+        worker.targets_ready.disconnect(self._on_targets_ready)
+        worker.frame_released.disconnect(self._on_frame_released)
+        _linger_until_finished(worker)
+    
+    def closeEvent(self, event):
+        """Nettoyage lors de la fermeture"""
+        self.cleanup()
+        super().closeEvent(event)
@@ -2,24 +2,99 @@
 # -*- coding: utf-8 -*-
 """
 Utilitaires d'export de données
+
+Les exports sont écrits en flux : les enregistrements (dictionnaires) sont
+consommés un par un depuis n'importe quel itérable, sans construire la
+table complète en mémoire.
 """
 
 import json
 import csv
+import logging
+from itertools import chain
 from pathlib import Path
 
+# orjson optionnel : sérialisation 2 à 4× plus rapide, repli sur json sinon
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Tampon d'écriture des exports (1 Mio)
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _dumps_record(record) -> str:
+    """Sérialise un enregistrement en JSON compact"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False)
+
+
 class DataExporter:
     """Exporteur de données vers différents formats"""
-    
+
     def __init__(self, config):
         self.config = config
-    
-    def export_to_csv(self, data, filepath):
-        """Export vers CSV"""
-        # TODO: Implémenter l'export CSV
-        pass
-    
-    def export_to_json(self, data, filepath):
-        """Export vers JSON"""
-        # TODO: Implémenter l'export JSON
-        pass
+
+    def export_to_csv(self, data, filepath) -> bool:
+        """Export vers CSV
+
+        Args:
+            data: Itérable d'enregistrements (dict), colonnes prises du premier
+            filepath: Fichier de destination
+
+        Returns:
+            True si l'export a réussi, False sinon
+        """
+        try:
+            records = iter(data)
+            first = next(records, None)
+            header = list(first) if first is not None else []
+
+            with open(Path(filepath), 'w', newline='', encoding='utf-8',
+                      buffering=_EXPORT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                if first is not None:
+                    writer.writerows(
+                        [record.get(key) for key in header]
+                        for record in chain((first,), records)
+                    )
+
+            logger.info(f"💾 Export CSV écrit: {filepath}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Erreur export CSV: {e}")
+            return False
+
+    def export_to_json(self, data, filepath) -> bool:
+        """Export vers JSON (tableau d'enregistrements, séparateurs compacts)
+
+        Args:
+            data: Itérable d'enregistrements (dict)
+            filepath: Fichier de destination
+
+        Returns:
+            True si l'export a réussi, False sinon
+        """
+        try:
+            with open(Path(filepath), 'w', encoding='utf-8',
+                      buffering=_EXPORT_BUFFER_SIZE) as f:
+                write = f.write
+                write('[')
+                separator = ''
+                for record in data:
+                    write(separator)
+                    write(_dumps_record(record))
+                    separator = ','
+                write(']')
+
+            logger.info(f"💾 Export JSON écrit: {filepath}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Erreur export JSON: {e}")
+            return False
@@ -1,12 +1,24 @@
 # robot_tracker/utils/logging_utils.py
-# Version 1.0 - Utilitaire de logging centralisé avec contrôle de verbosité
-# Modification: Création du module pour gérer les niveaux de verbosité
+# Version 1.2 - Niveaux des loggers par verbosité en table
+# Modification: _apply_verbosity_filters parcourt une table module au lieu d'une chaîne if/elif
 
 import logging
 import sys
+import weakref
 from typing import Dict, Optional
 
 
+# Niveaux appliqués aux loggers selon la verbosité : (nom du logger, niveau), '' = logger racine
+_VERBOSITY_LOGGER_LEVELS = {
+    # Suppression des logs de débogage des bibliothèques externes
+    "Faible": (('matplotlib', logging.WARNING), ('PIL', logging.WARNING), ('urllib3', logging.WARNING)),
+    # Réduction des logs PyQt et OpenCV
+    "Moyenne": (('PyQt6', logging.WARNING), ('cv2', logging.INFO)),
+    # Tous les logs activés, y compris ceux des bibliothèques
+    "Debug": (('', logging.DEBUG),)
+}
+
+
 class VerbosityManager:
     """Gestionnaire de verbosité des logs pour Robot Tracker"""
     
@@ -17,6 +29,9 @@ class VerbosityManager:
         "Debug": logging.DEBUG        # Tous les messages de débogage
     }
     
+    # ConfigManager → niveau validé (références faibles : pas de maintien en vie du gestionnaire)
+    _verbosity_cache = weakref.WeakKeyDictionary()
+    
     @classmethod
     def setup_logging(cls, verbosity: str = "Moyenne", config_manager=None) -> None:
         """Configure le système de logging selon le niveau de verbosité choisi
@@ -48,23 +63,8 @@ class VerbosityManager:
     def _apply_verbosity_filters(cls, verbosity: str, config_manager=None) -> None:
         """Applique des filtres spécifiques selon le niveau de verbosité"""
         
-        # Configuration pour verbosité "Faible"
-        if verbosity == "Faible":
-            # Suppression des logs de débogage des bibliothèques externes
-            logging.getLogger('matplotlib').setLevel(logging.WARNING)
-            logging.getLogger('PIL').setLevel(logging.WARNING)
-            logging.getLogger('urllib3').setLevel(logging.WARNING)
-            
-        # Configuration pour verbosité "Moyenne"  
-        elif verbosity == "Moyenne":
-            # Réduction des logs PyQt et OpenCV
-            logging.getLogger('PyQt6').setLevel(logging.WARNING)
-            logging.getLogger('cv2').setLevel(logging.INFO)
-            
-        # Configuration pour verbosité "Debug"
-        elif verbosity == "Debug":
-            # Tous les logs activés, y compris ceux des bibliothèques
-            logging.getLogger().setLevel(logging.DEBUG)
+        for logger_name, level in _VERBOSITY_LOGGER_LEVELS.get(verbosity, ()):
+            logging.getLogger(logger_name).setLevel(level)
     
     @classmethod
     def get_verbosity_from_config(cls, config_manager) -> str:
@@ -79,15 +79,25 @@ class VerbosityManager:
         if not config_manager:
             return "Moyenne"
         
+        cached = cls._verbosity_cache.get(config_manager)
+        if cached is not None:
+            return cached
+        
         verbosity = config_manager.get('ui', 'logging.console_verbosity', 'Moyenne')
         
         # Validation du niveau
         if verbosity not in cls.VERBOSITY_LEVELS:
             logging.warning(f"⚠️ Niveau de verbosité '{verbosity}' invalide, utilisation de 'Moyenne'")
-            return "Moyenne"
-            
+            verbosity = "Moyenne"
+        
+        cls._verbosity_cache[config_manager] = verbosity
         return verbosity
     
+    @classmethod
+    def clear_verbosity_cache(cls) -> None:
+        """Oublie les niveaux mémorisés (à appeler si la configuration est modifiée hors change_verbosity)"""
+        cls._verbosity_cache.clear()
+    
     @classmethod
     def get_available_levels(cls) -> list:
         """Retourne la liste des niveaux de verbosité disponibles"""
@@ -114,6 +124,7 @@ class VerbosityManager:
         if config_manager:
             config_manager.set('ui', 'logging.console_verbosity', new_verbosity)
             config_manager.save_config('ui')
+            cls._verbosity_cache[config_manager] = new_verbosity
         
         return True
 
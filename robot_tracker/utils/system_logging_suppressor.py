@@ -1,14 +1,42 @@
 # robot_tracker/utils/system_logging_suppressor.py
-# Version 1.1 - Suppresseur amélioré avec redirection stderr
-# Modification: Amélioration suppression OpenCV et messages configuration
+# Version 1.10 - Octets décodés pour un stderr sans flux binaire
+# Modification: sans .buffer, bytes décodés avec l'encodage du flux (errors='replace') avant l'écriture texte
 
 import os
+import re
 import sys
 import logging
 from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 from typing import Optional
 
+# Patterns à supprimer en mode Faible, compilés une fois en une seule regex insensible à la casse
+_SYSTEM_SUPPRESS_PATTERNS = (
+    'configuration', 'chargée', 'loaded', 'msmf', 'obsensor',
+    'camera index', 'readsample', 'grabframe', 'cap_msmf',
+    'videoio', 'démarrage', 'initialisation'
+)
+_SYSTEM_SUPPRESS_RE = re.compile('|'.join(map(re.escape, _SYSTEM_SUPPRESS_PATTERNS)), re.IGNORECASE)
+
+# Patterns OpenCV écrits sur stderr, compilés une fois en version str et bytes
+_OPENCV_STDERR_PATTERNS = (
+    'msmf', 'obsensor', 'camera index', 'readsample',
+    'grabframe', 'cap_msmf', 'videoio', 'onreadsample',
+    'async readsample', 'error status: -2147024809',
+    'global cap_msmf.cpp', 'global obsensor_uvc_stream_channel.cpp',
+    'warn:0@', 'error:1@'
+)
+_OPENCV_STDERR_RE = re.compile('|'.join(map(re.escape, _OPENCV_STDERR_PATTERNS)), re.IGNORECASE)
+_OPENCV_STDERR_RE_BYTES = re.compile(_OPENCV_STDERR_RE.pattern.encode('ascii'), re.IGNORECASE)
+# Plus court pattern : en dessous, aucune correspondance possible
+_OPENCV_STDERR_MIN_LEN = min(map(len, _OPENCV_STDERR_PATTERNS))
+
+# Loggers des modules externes à mettre en silence complète, résolus une fois (getLogger prend un verrou)
+_SILENCED_LOGGERS = tuple(logging.getLogger(module) for module in (
+    'cv2', 'numpy', 'matplotlib', 'PIL', 'PyQt6',
+    'urllib3', 'requests', 'asyncio', 'concurrent.futures'
+))
+
 
 class EnhancedOpenCVSuppressor:
     """Suppresseur amélioré pour les messages OpenCV C++"""
@@ -40,22 +68,32 @@ class EnhancedOpenCVSuppressor:
             def __init__(self, original_stderr):
                 self.original_stderr = original_stderr
                 
+                # Attributs consultés par les StreamHandler : copiés une fois plutôt que via __getattr__
+                self.encoding = getattr(original_stderr, 'encoding', None)
+                self.errors = getattr(original_stderr, 'errors', None)
+                self._binary_stderr = getattr(original_stderr, 'buffer', None)
+                if self._binary_stderr is not None:
+                    self.buffer = self._binary_stderr
+                
             def write(self, data):
-                if isinstance(data, str):
-                    data_lower = data.lower()
+                # Fragments trop courts pour contenir un pattern : pas de recherche
+                if isinstance(data, bytes):
+                    # Octets comparés tels quels (regex bytes), sans décodage
+                    if len(data) >= _OPENCV_STDERR_MIN_LEN and _OPENCV_STDERR_RE_BYTES.search(data):
+                        return
                     
-                    # Patterns OpenCV à supprimer
-                    opencv_patterns = [
-                        'msmf', 'obsensor', 'camera index', 'readsample',
-                        'grabframe', 'cap_msmf', 'videoio', 'onreadsample',
-                        'async readsample', 'error status: -2147024809',
-                        'global cap_msmf.cpp', 'global obsensor_uvc_stream_channel.cpp',
-                        'warn:0@', 'error:1@'
-                    ]
+                    # Écriture sur le flux binaire, couche texte vidée avant pour conserver l'ordre
+                    if self._binary_stderr is not None:
+                        self.original_stderr.flush()
+                        self._binary_stderr.write(data)
+                        return
                     
-                    # Vérifier si le message contient un pattern à supprimer
-                    if any(pattern in data_lower for pattern in opencv_patterns):
-                        return  # Supprimer le message
+                    # Flux texte seul (StringIO, console IDE) : write() n'accepte pas d'octets
+                    data = data.decode(self.encoding or 'utf-8', errors='replace')
+                        
+                # Texte comparé tel quel (regex insensible à la casse), sans .lower() ni encodage
+                elif len(data) >= _OPENCV_STDERR_MIN_LEN and _OPENCV_STDERR_RE.search(data):
+                    return
                 
                 # Écrire les autres messages normalement
                 self.original_stderr.write(data)
@@ -63,7 +101,23 @@ class EnhancedOpenCVSuppressor:
             def flush(self):
                 self.original_stderr.flush()
                 
+            def fileno(self):
+                return self.original_stderr.fileno()
+                
+            def isatty(self):
+                return self.original_stderr.isatty()
+                
+            def writable(self):
+                return self.original_stderr.writable()
+                
+            def readable(self):
+                return self.original_stderr.readable()
+                
+            def seekable(self):
+                return self.original_stderr.seekable()
+                
             def __getattr__(self, name):
+                # Filet de sécurité pour les attributs plus rares du flux d'origine
                 return getattr(self.original_stderr, name)
         
         return FilteredStderr(self.original_stderr)
@@ -75,6 +129,7 @@ class SystemLoggingSuppressor:
     def __init__(self):
         self.opencv_suppressor = EnhancedOpenCVSuppressor()
         self.original_log_filters = []
+        self._message_filter = None  # Créé une fois, partagé par tous les loggers filtrés
         
     def suppress_all_external_logs(self) -> None:
         """Supprime tous les logs externes (OpenCV, système, etc.)"""
@@ -110,13 +165,7 @@ class SystemLoggingSuppressor:
         """Configure le logging Python pour les modules externes"""
         
         # Modules à mettre en silence complète
-        silent_modules = [
-            'cv2', 'numpy', 'matplotlib', 'PIL', 'PyQt6',
-            'urllib3', 'requests', 'asyncio', 'concurrent.futures'
-        ]
-        
-        for module in silent_modules:
-            logger = logging.getLogger(module)
+        for logger in _SILENCED_LOGGERS:
             logger.setLevel(logging.CRITICAL)
             logger.propagate = False
     
@@ -127,30 +176,38 @@ class SystemLoggingSuppressor:
         import warnings
         warnings.filterwarnings('ignore')
         
-        # Filtre pour le logger racine
+        # Filtre des messages système, créé une fois
+        if self._message_filter is None:
+            self._message_filter = self._create_message_filter()
+        
+        # Application du filtre sur les seuls loggers externes : les handlers racine, partagés
+        # avec les logs de l'application, ne sont pas touchés. Le niveau du logger est comparé
+        # avant le filtre, les records sous CRITICAL ne sont jamais formatés.
+        # Un logger déjà filtré est ignoré : pas de filtre en double sur appels répétés.
+        message_filter = self._message_filter
+        for target in _SILENCED_LOGGERS:
+            if message_filter not in target.filters:
+                target.addFilter(message_filter)
+                self.original_log_filters.append((target, message_filter))
+    
+    @staticmethod
+    def _create_message_filter() -> logging.Filter:
+        """Crée le filtre des messages système du mode Faible"""
+        
         class SystemMessageFilter(logging.Filter):
-            def filter(self, record):
-                message = record.getMessage().lower()
+            def __init__(self):
+                super().__init__()
+                self._suppress_re = _SYSTEM_SUPPRESS_RE
                 
-                # Patterns à supprimer en mode Faible
-                suppress_patterns = [
-                    'configuration', 'chargée', 'loaded', 'msmf', 'obsensor',
-                    'camera index', 'readsample', 'grabframe', 'cap_msmf',
-                    'videoio', 'démarrage', 'initialisation'
-                ]
-                
-                # Supprimer si le message contient un pattern (sauf erreurs critiques)
-                if any(pattern in message for pattern in suppress_patterns):
-                    if record.levelno < logging.ERROR:
-                        return False
+            def filter(self, record):
+                # Erreurs toujours conservées : niveau testé avant tout formatage du message
+                if record.levelno >= logging.ERROR:
+                    return True
                 
-                return True
+                # Supprimer si le message contient un pattern (un seul passage regex, sans .lower())
+                return self._suppress_re.search(record.getMessage()) is None
         
-        # Application du filtre
-        root_logger = logging.getLogger()
-        message_filter = SystemMessageFilter()
-        root_logger.addFilter(message_filter)
-        self.original_log_filters.append(message_filter)
+        return SystemMessageFilter()
     
     def restore_logging(self) -> None:
         """Restaure le logging normal"""
@@ -159,9 +216,8 @@ class SystemLoggingSuppressor:
         self.opencv_suppressor.deactivate()
         
         # Suppression des filtres ajoutés
-        root_logger = logging.getLogger()
-        for filter_obj in self.original_log_filters:
-            root_logger.removeFilter(filter_obj)
+        for target, filter_obj in self.original_log_filters:
+            target.removeFilter(filter_obj)
         self.original_log_filters.clear()
     
     def __enter__(self):
@@ -197,11 +253,23 @@ class QuietConfigManager:
             config_logger.setLevel(original_level)
 
 
+# Suppresseur du mode Faible, créé au premier appel de apply_faible_mode_suppressions
+_faible_suppressor: Optional[SystemLoggingSuppressor] = None
+
+
 def apply_faible_mode_suppressions():
     """Applique toutes les suppressions pour le mode Faible"""
+    global _faible_suppressor
+    
+    # Déjà appliqué : filtre reposé seulement sur les loggers externes qui l'auraient perdu
+    if _faible_suppressor is not None and _faible_suppressor.opencv_suppressor.is_active:
+        _faible_suppressor._setup_logging_filters()
+        return _faible_suppressor
     
-    # Suppression des logs système
-    suppressor = SystemLoggingSuppressor()
+    # Suppression des logs système (instance unique, réactivée si restaurée entre-temps)
+    if _faible_suppressor is None:
+        _faible_suppressor = SystemLoggingSuppressor()
+    suppressor = _faible_suppressor
     suppressor.suppress_all_external_logs()
     
     # Configuration spéciale OpenCV avec gestion des versions
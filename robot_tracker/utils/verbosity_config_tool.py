@@ -1,46 +1,84 @@
 # robot_tracker/utils/verbosity_config_tool.py
-# Version 1.0 - Outil de configuration verbosité
-# Modification: Script utilitaire pour changer la verbosité des logs
+# Version 1.14 - Lecture directe des arguments limitée aux formes exactes
+# Modification: --opt=val, option répétée ou valeur vide/tiret renvoyés à argparse
 
 import sys
-import argparse
+import weakref
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional
 
-# Ajout du chemin vers le module principal
-sys.path.append(str(Path(__file__).parent.parent))
+# Ajout du chemin vers le module principal, seulement en exécution directe du script
+# (importé en tant que utils.verbosity_config_tool, robot_tracker est déjà dans sys.path)
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
 
 from core.config_manager import ConfigManager
-from utils.logging_utils import VerbosityManager
 
+# Lignes de séparation des bannières et sections
+_SEP_40 = "-" * 40
+_SEP_50 = "=" * 50
+_SEP_60 = "=" * 60
 
-def display_current_config(config: ConfigManager):
-    """Affiche la configuration actuelle de verbosité"""
-    print("\n📋 Configuration actuelle:")
-    print("-" * 40)
+# ConfigManager → {niveau: description}, rempli à la première lecture (indépendant du niveau courant).
+# Références faibles : un gestionnaire (autre dossier de config) n'hérite jamais du cache d'un autre.
+_description_cache = weakref.WeakKeyDictionary()
+
+# ConfigManager → niveaux valides, construits à la première validation pour ce gestionnaire
+_valid_levels = weakref.WeakKeyDictionary()
+
+
+def _get_verbosity_description(config: ConfigManager, level: str) -> str:
+    """Description d'un niveau, lue une seule fois dans la configuration de ce gestionnaire"""
+    descriptions = _description_cache.get(config)
+    if descriptions is None:
+        descriptions = _description_cache[config] = {}
+    description = descriptions.get(level)
+    if description is None:
+        description = descriptions[level] = config.get_verbosity_description(level)
+    return description
+
+
+def display_current_config(config: ConfigManager, available_levels: Optional[List[str]] = None,
+                           current_verbosity: Optional[str] = None):
+    """Affiche la configuration actuelle de verbosité (une seule écriture sur stdout)
     
-    current_verbosity = config.get_logging_verbosity()
-    available_levels = config.get_available_verbosity_levels()
+    Args:
+        config: Instance du ConfigManager
+        available_levels: Niveaux déjà lus par l'appelant, relus en configuration si None
+        current_verbosity: Niveau courant déjà connu de l'appelant, relu en configuration si None
+    """
+    if current_verbosity is None:
+        current_verbosity = config.get_logging_verbosity()
+    if available_levels is None:
+        available_levels = config.get_available_verbosity_levels()
     
-    print(f"🔧 Verbosité actuelle: {current_verbosity}")
-    print(f"📝 Description: {config.get_verbosity_description(current_verbosity)}")
-    print(f"📋 Niveaux disponibles: {', '.join(available_levels)}")
+    lines = [
+        "\n📋 Configuration actuelle:",
+        _SEP_40,
+        f"🔧 Verbosité actuelle: {current_verbosity}",
+        f"📝 Description: {_get_verbosity_description(config, current_verbosity)}",
+        f"📋 Niveaux disponibles: {', '.join(available_levels)}",
+        # Affichage des descriptions de tous les niveaux
+        "\n📚 Descriptions des niveaux:"
+    ]
+    lines.extend(
+        f"{'👉' if level == current_verbosity else '  '} {level:8}: {_get_verbosity_description(config, level)}"
+        for level in available_levels
+    )
     
-    # Affichage des descriptions de tous les niveaux
-    print("\n📚 Descriptions des niveaux:")
-    for level in available_levels:
-        description = config.get_verbosity_description(level)
-        marker = "👉" if level == current_verbosity else "  "
-        print(f"{marker} {level:8}: {description}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def change_verbosity(config: ConfigManager, new_level: str) -> bool:
     """Change le niveau de verbosité"""
-    
-    # Validation du niveau
-    available_levels = config.get_available_verbosity_levels()
-    if new_level not in available_levels:
+    # Validation du niveau (test d'appartenance haché, liste ordonnée relue seulement pour l'erreur)
+    valid_levels = _valid_levels.get(config)
+    if valid_levels is None:
+        valid_levels = _valid_levels[config] = frozenset(config.get_available_verbosity_levels())
+    if new_level not in valid_levels:
         print(f"❌ Niveau '{new_level}' invalide!")
-        print(f"📋 Niveaux disponibles: {', '.join(available_levels)}")
+        print(f"📋 Niveaux disponibles: {', '.join(config.get_available_verbosity_levels())}")
         return False
     
     # Changement de la verbosité
@@ -61,13 +99,31 @@ def change_verbosity(config: ConfigManager, new_level: str) -> bool:
     return True
 
 
+def _prompt(message: str) -> str:
+    """Affiche une invite et lit une ligne nettoyée sur stdin (EOFError en fin d'entrée)"""
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
 def interactive_mode(config: ConfigManager):
     """Mode interactif pour changer la verbosité"""
     print("\n🔄 Mode interactif de configuration verbosité")
-    print("=" * 50)
+    print(_SEP_50)
+    
+    # Niveaux lus une fois (descriptions mémorisées) : seul le niveau courant change pendant la session
+    available_levels = config.get_available_verbosity_levels()
+    
+    # Configuration réaffichée seulement au démarrage, après un changement réussi ou sur demande (choix 2)
+    dirty = True
     
     while True:
-        display_current_config(config)
+        if dirty:
+            display_current_config(config, available_levels)
+            dirty = False
         
         print("\n🎯 Actions disponibles:")
         print("  1. Changer la verbosité")
@@ -76,22 +132,21 @@ def interactive_mode(config: ConfigManager):
         print("  0. Quitter")
         
         try:
-            choice = input("\n👉 Votre choix (0-3): ").strip()
+            choice = _prompt("\n👉 Votre choix (0-3): ")
             
             if choice == "0":
                 print("👋 Au revoir!")
                 break
                 
             elif choice == "1":
-                available_levels = config.get_available_verbosity_levels()
                 print(f"\n📋 Niveaux disponibles: {', '.join(available_levels)}")
-                new_level = input("👉 Nouveau niveau: ").strip()
+                new_level = _prompt("👉 Nouveau niveau: ")
                 
                 if new_level:
-                    change_verbosity(config, new_level)
+                    dirty = change_verbosity(config, new_level)
                 
             elif choice == "2":
-                continue  # La configuration s'affiche déjà en haut de boucle
+                dirty = True  # La configuration s'affiche en haut de boucle
                 
             elif choice == "3":
                 test_logging_messages()
@@ -99,7 +154,7 @@ def interactive_mode(config: ConfigManager):
             else:
                 print("⚠️  Choix invalide, veuillez entrer 0, 1, 2 ou 3")
                 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n👋 Arrêt demandé, au revoir!")
             break
         except Exception as e:
@@ -111,7 +166,7 @@ def test_logging_messages():
     import logging
     
     print("\n🧪 Test des messages de logging:")
-    print("-" * 40)
+    print(_SEP_40)
     
     logger = logging.getLogger("verbosity_test")
     
@@ -123,13 +178,9 @@ def test_logging_messages():
     print("📝 Seuls les messages correspondant au niveau configuré sont affichés")
 
 
-def main():
-    """Point d'entrée principal de l'outil"""
-    
-    parser = argparse.ArgumentParser(
-        description="🔧 Outil de configuration de verbosité pour Robot Tracker",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Textes d'aide du parser argparse (chemin lent : -h/--help, erreurs)
+_DESCRIPTION = "🔧 Outil de configuration de verbosité pour Robot Tracker"
+_EPILOG = """
 Exemples d'utilisation:
   python verbosity_config_tool.py                    # Mode interactif
   python verbosity_config_tool.py --show             # Afficher config actuelle
@@ -137,6 +188,20 @@ Exemples d'utilisation:
   python verbosity_config_tool.py --set Faible       # Définir niveau Faible
   python verbosity_config_tool.py --test             # Tester messages logging
         """
+
+# Options à valeur et options booléennes reconnues par la lecture directe des arguments
+_VALUE_OPTIONS = {'--set': 'set', '--config-dir': 'config_dir'}
+_FLAG_OPTIONS = {'--show': 'show', '--test': 'test'}
+
+
+def _build_parser():
+    """Construit le parser argparse complet (aide, abréviations, messages d'erreur)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -160,10 +225,47 @@ Exemples d'utilisation:
         help='Dossier de configuration personnalisé'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Lit les options sans argparse, None si argparse doit prendre le relais
+    
+    Seules les formes exactes sont acceptées : --show, --test, --set NIVEAU et
+    --config-dir DOSSIER, chaque option au plus une fois. Tout le reste (-h, --opt=val,
+    abréviation, répétition, valeur vide ou commençant par un tiret) passe par argparse.
+    """
+    args = SimpleNamespace(set=None, show=False, test=False, config_dir=None)
+    seen = set()
+    
+    tokens = iter(argv)
+    for token in tokens:
+        if token in seen:
+            return None  # Option répétée : sémantique laissée à argparse
+        seen.add(token)
+        
+        if token in _FLAG_OPTIONS:
+            setattr(args, _FLAG_OPTIONS[token], True)
+        elif token in _VALUE_OPTIONS:
+            value = next(tokens, None)
+            if not value or value.startswith('-'):
+                return None  # Valeur manquante : message d'erreur argparse
+            setattr(args, _VALUE_OPTIONS[token], value)
+        else:
+            return None  # Forme non reconnue : argparse
+    
+    return args
+
+
+def main():
+    """Point d'entrée principal de l'outil"""
+    
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
     
     print("🔧 Robot Tracker - Outil de Configuration Verbosité")
-    print("=" * 60)
+    print(_SEP_60)
     
     try:
         # Chargement de la configuration
@@ -175,8 +277,9 @@ Exemples d'utilisation:
             display_current_config(config)
             
         elif args.set:
-            change_verbosity(config, args.set)
-            display_current_config(config)
+            # Niveau appliqué connu : l'affichage ne relit pas la configuration
+            changed = change_verbosity(config, args.set)
+            display_current_config(config, current_verbosity=args.set if changed else None)
             
         elif args.test:
             # Configuration du logging pour le test